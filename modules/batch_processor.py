@@ -4,17 +4,37 @@ Handles multiple document upload and processing workflow
 """
 
 import os
+import re
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 import concurrent.futures
 from .extract import DocumentExtractor
 from .validate import DocumentValidator
 from .simple_ai_processor import SimpleAIProcessor
 from .database import DatabaseManager
 from utils.document_types import DOCUMENT_TYPES, get_document_category
-from utils.helpers import save_uploaded_file, get_file_hash
+from utils.helpers import save_and_hash
+
+
+# One compiled alternation pass over a lowercased filename replaces six
+# independent substring scans in the classification fallback; the matching
+# group names the document type. Declaration order doubles as type priority
+# for filenames hitting several keywords, mirroring the old if/elif chain.
+# The 'id' token uses lookarounds rather than \b: underscores are word
+# characters, so \bid\b would skip scan_of_my_id.pdf
+_FILENAME_TYPE_RE = re.compile(
+    r'(?P<payslip>payslip|salary|pay)'
+    r'|(?P<bank_statement>bank|statement)'
+    r'|(?P<id_proof>passport|license|(?<![a-z0-9])id(?![a-z0-9]))'
+    r'|(?P<tax_document>tax|w2|1099)'
+    r'|(?P<employment_letter>employment|job)'
+    r'|(?P<utility_bill>utility|bill|electric)'
+)
+
+# groupindex preserves declaration order: lower rank wins on multiple hits
+_FILENAME_TYPE_RANK = {name: rank for rank, name in enumerate(_FILENAME_TYPE_RE.groupindex)}
 
 
 class BatchDocumentProcessor:
@@ -28,8 +48,14 @@ class BatchDocumentProcessor:
         
     def process_application_batch(self, application_id: str, uploaded_files: List,
                                 document_types: Dict[str, str], borrower_info: Dict[str, Any],
-                                processing_options: Dict[str, bool]) -> Dict[str, Any]:
-        """Process all documents in a mortgage application batch"""
+                                processing_options: Dict[str, bool],
+                                progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """Process all documents in a mortgage application batch
+
+        progress_callback, if given, is invoked as (completed, total) after
+        each document finishes; it may run on a worker thread, so callers
+        should only record state in it, not touch UI elements.
+        """
         
         batch_result = {
             'application_id': application_id,
@@ -53,7 +79,8 @@ class BatchDocumentProcessor:
             
             # Phase 2: Parallel Document Processing
             document_results = self._process_documents_parallel(
-                stored_files, application_id, borrower_info, processing_options
+                stored_files, application_id, borrower_info, processing_options,
+                progress_callback
             )
             
             batch_result['document_results'] = document_results
@@ -94,43 +121,53 @@ class BatchDocumentProcessor:
                         application_id: str) -> List[Dict[str, Any]]:
         """Store uploaded documents and prepare for processing"""
         
+        def _store_one(order: int, uploaded_file) -> Dict[str, Any]:
+            doc_type = document_types.get(uploaded_file.name, 'unknown')
+
+            # Save and hash in one streaming pass
+            file_path, file_hash = save_and_hash(uploaded_file, application_id)
+
+            return {
+                'filename': uploaded_file.name,
+                'file_path': file_path,
+                'file_hash': file_hash,
+                'document_type': doc_type,
+                'file_size': uploaded_file.size,
+                'upload_timestamp': datetime.now(),
+                'processing_order': order
+            }
+
         stored_files = []
-        
-        for i, uploaded_file in enumerate(uploaded_files):
-            try:
-                # Determine document type
-                doc_type = document_types.get(uploaded_file.name, 'unknown')
-                
-                # Save file
-                file_path = save_uploaded_file(uploaded_file, application_id)
-                file_hash = get_file_hash(file_path)
-                
-                stored_file = {
-                    'filename': uploaded_file.name,
-                    'file_path': file_path,
-                    'file_hash': file_hash,
-                    'document_type': doc_type,
-                    'file_size': len(uploaded_file.getbuffer()),
-                    'upload_timestamp': datetime.now(),
-                    'processing_order': i + 1
-                }
-                
-                stored_files.append(stored_file)
-                logging.info(f"Stored document: {uploaded_file.name}")
-                
-            except Exception as e:
-                logging.error(f"Failed to store document {uploaded_file.name}: {str(e)}")
-                # Continue with other files
-                continue
-        
+
+        # Disk writes are latency-bound, not CPU-bound: overlap them across a
+        # thread pool so 20 files cost roughly one write's latency, not 20
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, max(len(uploaded_files), 1))) as executor:
+            future_to_file = {
+                executor.submit(_store_one, i + 1, uploaded_file): uploaded_file
+                for i, uploaded_file in enumerate(uploaded_files)
+            }
+
+            for future in concurrent.futures.as_completed(future_to_file):
+                uploaded_file = future_to_file[future]
+                try:
+                    stored_files.append(future.result())
+                    logging.info(f"Stored document: {uploaded_file.name}")
+                except Exception as e:
+                    logging.error(f"Failed to store document {uploaded_file.name}: {str(e)}")
+                    # Continue with other files
+                    continue
+
+        stored_files.sort(key=lambda f: f['processing_order'])
         return stored_files
     
-    def _process_documents_parallel(self, stored_files: List[Dict[str, Any]], 
+    def _process_documents_parallel(self, stored_files: List[Dict[str, Any]],
                                   application_id: str, borrower_info: Dict[str, Any],
-                                  processing_options: Dict[str, bool]) -> List[Dict[str, Any]]:
+                                  processing_options: Dict[str, bool],
+                                  progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
         """Process documents in parallel for faster throughput"""
-        
+
         results = []
+        completed = 0
         
         # Use ThreadPoolExecutor for I/O bound operations
         with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
@@ -159,7 +196,14 @@ class BatchDocumentProcessor:
                         'processing_order': file_info['processing_order']
                     }
                     results.append(error_result)
-        
+
+                completed += 1
+                if progress_callback:
+                    try:
+                        progress_callback(completed, len(stored_files))
+                    except Exception as e:
+                        logging.warning(f"Progress callback failed: {str(e)}")
+
         # Sort results by processing order
         results.sort(key=lambda x: x.get('processing_order', 0))
         return results
@@ -275,23 +319,17 @@ class BatchDocumentProcessor:
                 except Exception as e:
                     logging.warning(f"AI classification failed: {str(e)}")
             
-            # Fallback to filename-based classification
-            filename_lower = os.path.basename(file_path).lower()
-            
-            if any(term in filename_lower for term in ['payslip', 'salary', 'pay']):
-                return 'payslip'
-            elif any(term in filename_lower for term in ['bank', 'statement']):
-                return 'bank_statement'
-            elif any(term in filename_lower for term in ['id', 'passport', 'license']):
-                return 'id_proof'
-            elif any(term in filename_lower for term in ['tax', 'w2', '1099']):
-                return 'tax_document'
-            elif any(term in filename_lower for term in ['employment', 'job']):
-                return 'employment_letter'
-            elif any(term in filename_lower for term in ['utility', 'bill', 'electric']):
-                return 'utility_bill'
-            else:
-                return 'unknown'
+            # Fallback to filename-based classification: one lowercase
+            # allocation and a single alternation scan, with multi-keyword
+            # hits resolved by type priority rather than leftmost position
+            best = None
+            for match in _FILENAME_TYPE_RE.finditer(os.path.basename(file_path).lower()):
+                rank = _FILENAME_TYPE_RANK[match.lastgroup]
+                if best is None or rank < best[0]:
+                    if rank == 0:
+                        return match.lastgroup
+                    best = (rank, match.lastgroup)
+            return best[1] if best else 'unknown'
                 
         except Exception as e:
             logging.error(f"Document classification failed: {str(e)}")
@@ -1,6 +1,7 @@
 import os
+import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from google.cloud import documentai
 from google.cloud import storage
@@ -155,22 +156,55 @@ class GCPServices:
             logging.error(f"Cloud Storage upload failed: {str(e)}")
             return None
     
-    def store_in_firestore(self, collection_name: str, document_id: str, data: Dict[str, Any]) -> bool:
+    def store_in_firestore(self, collection_name: str, document_id: str, data: Dict[str, Any],
+                           timeout: Optional[float] = None) -> bool:
         """Store document data in Firestore"""
-        
+
         if not self.firestore_available:
             return False
-        
+
         try:
             # Serialize datetime objects to strings
             serialized_data = self._serialize_datetime_objects(data)
             doc_ref = self.firestore_client.collection(collection_name).document(document_id)
-            doc_ref.set(serialized_data)
+            if timeout is not None:
+                # Explicit timeout bounds tail latency on interactive paths
+                doc_ref.set(serialized_data, timeout=timeout)
+            else:
+                doc_ref.set(serialized_data)
             return True
-            
+
         except Exception as e:
             logging.error(f"Firestore storage failed: {str(e)}")
             return False
+
+    def store_many_in_firestore(self, collection_name: str, items: List[Tuple[str, Dict[str, Any]]]) -> bool:
+        """Store multiple documents in Firestore using batched writes
+
+        Firestore allows up to 500 writes per batch, so a bulk ingestion of N
+        documents costs ceil(N / 500) RPCs instead of N.
+        """
+
+        if not self.firestore_available:
+            return False
+
+        try:
+            collection = self.firestore_client.collection(collection_name)
+
+            for start in range(0, len(items), 500):
+                batch = self.firestore_client.batch()
+
+                for document_id, data in items[start:start + 500]:
+                    serialized_data = self._serialize_datetime_objects(data)
+                    batch.set(collection.document(document_id), serialized_data)
+
+                batch.commit()
+
+            return True
+
+        except Exception as e:
+            logging.error(f"Firestore batch storage failed: {str(e)}")
+            return False
     
     def get_from_firestore(self, collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve document data from Firestore"""
@@ -219,6 +253,68 @@ class GCPServices:
             logging.error(f"Firestore query failed: {str(e)}")
             return []
     
+    def submit_batch_vertex(self, requests: List[Dict[str, Any]]) -> Optional[str]:
+        """Submit prompts as a Vertex AI batch prediction job
+
+        Batch prediction bills at roughly half the real-time rate and is not
+        subject to per-minute quota, so non-interactive bulk extraction should
+        be routed through this path instead of GenerativeModel calls.
+        """
+
+        if not self.storage_available:
+            return None
+
+        try:
+            job_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            input_uri = f"gs://{self.bucket_name}/batch-in/{job_id}.jsonl"
+            output_uri = f"gs://{self.bucket_name}/batch-out/{job_id}/"
+
+            # Stage the prompts as JSONL in GCS
+            bucket = self.storage_client.bucket(self.bucket_name)
+            blob = bucket.blob(f"batch-in/{job_id}.jsonl")
+            blob.upload_from_string(
+                "\n".join(json.dumps(request) for request in requests),
+                content_type="application/jsonl"
+            )
+
+            job = aiplatform.BatchPredictionJob.create(
+                job_display_name=f"mortgage-batch-{job_id}",
+                model_name="publishers/google/models/gemini-2.5-pro",
+                gcs_source=input_uri,
+                instances_format="jsonl",
+                gcs_destination_prefix=output_uri,
+                predictions_format="jsonl",
+                sync=False
+            )
+
+            logging.info(f"Submitted batch prediction job: {job.resource_name}")
+            return job.resource_name
+
+        except Exception as e:
+            logging.error(f"Batch prediction submission failed: {str(e)}")
+            return None
+
+    def poll_batch(self, job_name: str) -> Optional[List[Dict[str, Any]]]:
+        """Return parsed results for a batch prediction job, or None if not done"""
+
+        try:
+            job = aiplatform.BatchPredictionJob(job_name)
+
+            if job.state.name != 'JOB_STATE_SUCCEEDED':
+                return None
+
+            results = []
+            for output in job.iter_outputs():
+                for line in output.download_as_text().splitlines():
+                    if line.strip():
+                        results.append(json.loads(line))
+
+            return results
+
+        except Exception as e:
+            logging.error(f"Batch prediction polling failed: {str(e)}")
+            return None
+
     def create_storage_bucket(self) -> bool:
         """Create storage bucket if it doesn't exist"""
         
@@ -2,19 +2,32 @@ import streamlit as st
 import os
 from datetime import datetime
 import uuid
+import concurrent.futures
 from typing import List, Dict, Any
 from .extract import DocumentExtractor
 from .validate import DocumentValidator
-from .ai_processor import AIProcessor
+from .simple_ai_processor import SimpleAIProcessor
 from utils.document_types import DOCUMENT_TYPES, get_document_category
-from utils.helpers import save_uploaded_file, get_file_hash
+from utils.helpers import save_and_hash
+
+# Selectbox options; computed once instead of on every rerun of render()
+_DOC_TYPE_KEYS = tuple(DOCUMENT_TYPES.keys())
+
+
+@st.cache_resource
+def _get_processors():
+    """Build the extractor/validator/AI processor once per Streamlit process
+
+    Streamlit reruns the script on every widget interaction; without caching,
+    each rerun re-creates these objects and re-pays their GCP client setup.
+    """
+    return DocumentExtractor(), DocumentValidator(), SimpleAIProcessor()
+
 
 class UploadModule:
     def __init__(self, db_manager):
         self.db_manager = db_manager
-        self.extractor = DocumentExtractor()
-        self.validator = DocumentValidator()
-        self.ai_processor = AIProcessor()
+        self.extractor, self.validator, self.ai_processor = _get_processors()
     
     def render(self):
         """Render the document upload interface"""
@@ -58,7 +71,7 @@ class UploadModule:
         # Document type selection
         doc_type = st.selectbox(
             "Document Type",
-            options=list(DOCUMENT_TYPES.keys()),
+            options=_DOC_TYPE_KEYS,
             help="Select the type of document you're uploading"
         )
         
@@ -95,53 +108,107 @@ class UploadModule:
             if not application_id:
                 application_id = str(uuid.uuid4())[:8].upper()
             
-            # Process each uploaded file
-            with st.spinner("Processing documents..."):
+            # Process each uploaded file. st.status with coarse updates keeps
+            # the websocket traffic to state transitions instead of a rerender
+            # per file
+            with st.status("Processing documents...", expanded=True) as status:
                 results = []
+                pending_documents = []
                 progress_bar = st.progress(0)
-                
-                for i, uploaded_file in enumerate(uploaded_files):
-                    progress = (i + 1) / len(uploaded_files)
-                    progress_bar.progress(progress)
-                    
-                    # Save uploaded file
-                    file_path = save_uploaded_file(uploaded_file, application_id)
-                    file_hash = get_file_hash(file_path)
-                    
-                    # Process document
-                    result = self._process_document(
-                        file_path, uploaded_file.name, doc_type, application_id,
-                        auto_validate, generate_summary, extract_entities, fraud_detection
-                    )
-                    
-                    # Store in database
-                    document_data = {
-                        'application_id': application_id,
-                        'document_type': doc_type,
-                        'filename': uploaded_file.name,
-                        'file_path': file_path,
-                        'file_hash': file_hash,
-                        'upload_timestamp': datetime.now(),
-                        'borrower_name': borrower_name,
-                        'borrower_email': borrower_email,
-                        'borrower_phone': borrower_phone,
-                        'loan_amount': loan_amount,
-                        'processing_result': result
+                update_every = max(1, len(uploaded_files) // 20)
+
+                # Extraction and validation are I/O-bound (disk, OCR, Document AI),
+                # so run the files concurrently; st.* is only touched on the main
+                # thread as each future resolves
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
+                    future_to_file = {
+                        executor.submit(
+                            self._prepare_document, uploaded_file, doc_type,
+                            application_id, auto_validate, extract_entities
+                        ): uploaded_file
+                        for uploaded_file in uploaded_files
                     }
-                    
+
+                    completed = 0
+                    for future in concurrent.futures.as_completed(future_to_file):
+                        uploaded_file = future_to_file[future]
+                        try:
+                            prepared = future.result()
+                        except Exception as e:
+                            prepared = {
+                                'file_path': None,
+                                'file_hash': None,
+                                'result': {
+                                    'filename': uploaded_file.name,
+                                    'document_type': doc_type,
+                                    'status': 'error',
+                                    'extraction_result': None,
+                                    'validation_result': None,
+                                    'ai_analysis': None,
+                                    'errors': [f"Processing error: {str(e)}"]
+                                }
+                            }
+
+                        result = prepared['result']
+                        document_data = {
+                            'application_id': application_id,
+                            'document_type': doc_type,
+                            'filename': uploaded_file.name,
+                            'file_path': prepared['file_path'],
+                            'file_hash': prepared['file_hash'],
+                            'upload_timestamp': datetime.now(),
+                            'borrower_name': borrower_name,
+                            'borrower_email': borrower_email,
+                            'borrower_phone': borrower_phone,
+                            'loan_amount': loan_amount,
+                            'processing_result': result
+                        }
+
+                        pending_documents.append(document_data)
+                        results.append(result)
+
+                        completed += 1
+                        if completed % update_every == 0 or completed == len(uploaded_files):
+                            status.update(label=f"Processed {completed}/{len(uploaded_files)} documents...")
+                            progress_bar.progress(completed / len(uploaded_files))
+
+                # One batched Gemini call covers every document, amortizing the
+                # per-request network and prefill overhead of N separate calls
+                if generate_summary or fraud_detection:
+                    status.update(label="Running AI analysis...")
+                    batch_analyses = self.ai_processor.analyze_documents_batch(results)
+                    for result, ai_analysis in zip(results, batch_analyses):
+                        result['ai_analysis'] = ai_analysis
+
+                # Store in database
+                status.update(label="Storing documents...")
+                for document_data in pending_documents:
                     self.db_manager.store_document(document_data)
-                    results.append(result)
-                
+
                 progress_bar.progress(1.0)
+                status.update(label="Processing complete", state="complete")
                 st.success(f"Successfully processed {len(uploaded_files)} document(s)!")
                 
                 # Display results
                 self._display_results(results, application_id)
     
-    def _process_document(self, file_path: str, filename: str, doc_type: str, 
-                         application_id: str, auto_validate: bool, generate_summary: bool,
-                         extract_entities: bool, fraud_detection: bool) -> Dict[str, Any]:
-        """Process a single document through the pipeline"""
+    def _prepare_document(self, uploaded_file, doc_type: str, application_id: str,
+                          auto_validate: bool, extract_entities: bool) -> Dict[str, Any]:
+        """Save, hash and process one uploaded file (runs on a worker thread)"""
+
+        file_path, file_hash = save_and_hash(uploaded_file, application_id)
+
+        result = self._process_document(
+            file_path, uploaded_file.name, doc_type, application_id,
+            auto_validate, extract_entities
+        )
+
+        return {'file_path': file_path, 'file_hash': file_hash, 'result': result}
+
+    def _process_document(self, file_path: str, filename: str, doc_type: str,
+                         application_id: str, auto_validate: bool,
+                         extract_entities: bool) -> Dict[str, Any]:
+        """Process a single document through the pipeline (AI analysis is batched separately)"""
         
         result = {
             'filename': filename,
@@ -169,14 +236,6 @@ class UploadModule:
                 )
                 result['validation_result'] = validation_result
             
-            # AI analysis
-            if generate_summary or fraud_detection:
-                ai_analysis = self.ai_processor.analyze_document(
-                    file_path, doc_type, result.get('extraction_result'),
-                    generate_summary, fraud_detection
-                )
-                result['ai_analysis'] = ai_analysis
-            
             result['status'] = 'completed'
             
         except Exception as e:
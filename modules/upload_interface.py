@@ -2,13 +2,87 @@
 Modern bank-style document upload interface for mortgage applications
 """
 
+import re
+import time
+import secrets
+import concurrent.futures
 import streamlit as st
-import uuid
+import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from .batch_processor import BatchDocumentProcessor
-from utils.document_types import DOCUMENT_TYPES, MANDATORY_DOCUMENTS
-from utils.helpers import validate_file_upload, get_file_icon
+from utils.document_types import DOCUMENT_TYPES, MANDATORY_DOCUMENTS, MANDATORY_DOCUMENTS_SET
+from utils.helpers import validate_file_upload_head, get_file_icon
+
+# Compiled once; the submit path shouldn't re-parse the pattern per click
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Display-name map so the selectbox format_func is a single dict lookup
+# instead of a nested DOCUMENT_TYPES[x]['name'] per option per render
+_DOC_NAME_BY_KEY = {key: info['name'] for key, info in DOCUMENT_TYPES.items()}
+
+# Static progress-steps block; one markdown delta per rerun instead of
+# eight calls across four columns
+_PROGRESS_STEPS_MD = """
+| **1. 📋 Information** | **2. 📎 Upload** | **3. 🔍 Review** | **4. ✨ Processing** |
+| --- | --- | --- | --- |
+| ✅ Current Step | ⏳ Next | ⏳ Pending | ⏳ Pending |
+"""
+
+
+# One alternation pass over the filename replaces six independent substring
+# scans in _suggest_document_type; the matching group names the document type.
+# Group declaration order doubles as type priority so a filename hitting
+# several keywords resolves the same way the old if/elif chain did. The 'id'
+# token uses lookarounds rather than \b: underscores are word characters, so
+# \bid\b would skip the common my_id.pdf style while still matching video.pdf
+_DOC_TYPE_RE = re.compile(
+    r'(?P<payslip>payslip|salary|pay_stub|wage)'
+    r'|(?P<bank_statement>bank|statement|account)'
+    r'|(?P<id_proof>passport|license|identity|(?<![a-z0-9])id(?![a-z0-9]))'
+    r'|(?P<tax_document>tax|1040|return|w2)'
+    r'|(?P<employment_letter>employment|job|work)'
+    r'|(?P<utility_bill>utility|electric|gas|water)'
+)
+
+# groupindex preserves declaration order: lower rank wins on multiple hits
+_DOC_TYPE_RANK = {name: rank for rank, name in enumerate(_DOC_TYPE_RE.groupindex)}
+
+
+@st.cache_data(show_spinner=False)
+def _cached_validate(name: str, size: int, head: bytes) -> Dict[str, Any]:
+    """Memoized file validation keyed on (name, size, first bytes)
+
+    Streamlit reruns the script on every widget change, so without caching
+    each file is re-validated per keystroke.
+    """
+    return validate_file_upload_head(name, size, head)
+
+
+def _validate_uploaded_file(file) -> Dict[str, Any]:
+    """Validate one uploaded file through the rerun cache (thread-safe)
+
+    Only the first 512 bytes are read: enough for magic-byte detection
+    without shuffling whole multi-MB documents through memory per rerun.
+    Oversized files are rejected on the size attribute alone, before any
+    bytes are read.
+    """
+    if file.size > 10 * 1024 * 1024:
+        file_size_mb = file.size / (1024 * 1024)
+        return {
+            'is_valid': False,
+            'errors': [f"File size ({file_size_mb:.2f} MB) exceeds maximum allowed size (10 MB)"],
+            'warnings': [],
+            'file_info': {
+                'size_bytes': file.size,
+                'size_mb': round(file_size_mb, 2),
+                'filename': file.name
+            }
+        }
+
+    file.seek(0)
+    head = file.read(512)
+    file.seek(0)
+    return _cached_validate(file.name, file.size, head)
 
 
 class MortgageUploadInterface:
@@ -16,7 +90,20 @@ class MortgageUploadInterface:
     
     def __init__(self, db_manager):
         self.db_manager = db_manager
-        self.batch_processor = BatchDocumentProcessor(db_manager)
+        self._batch_processor = None
+
+    @property
+    def batch_processor(self):
+        """Lazily import and build the batch processor on first submit
+
+        The batch_processor module pulls in the extractors and LLM clients;
+        deferring the import keeps first paint fast for users who only view
+        the form and never submit.
+        """
+        if self._batch_processor is None:
+            from .batch_processor import BatchDocumentProcessor
+            self._batch_processor = BatchDocumentProcessor(self.db_manager)
+        return self._batch_processor
     
     def render(self):
         """Render the main upload interface"""
@@ -40,52 +127,47 @@ class MortgageUploadInterface:
                 application_id = self._handle_application_id()
         
         st.divider()
-        
-        # Document upload section
+
+        # Document upload section (fragment-scoped, see below)
+        self._upload_and_classify(borrower_info, application_id)
+
+    @st.fragment
+    def _upload_and_classify(self, borrower_info: Dict[str, Any], application_id: str):
+        """Render upload, classification and options as an isolated fragment
+
+        Widget changes inside this block (checkboxes, per-file selectboxes)
+        rerun only the fragment instead of the whole page, so toggling an
+        option no longer re-renders the borrower form or re-validates files.
+        """
+
         with st.container():
             st.markdown("### 📎 Document Upload")
-            
+
             # Document requirements info
             self._show_document_requirements()
-            
+
             # Bulk file upload
             uploaded_files = self._render_file_upload()
-            
+
             if uploaded_files:
                 # Document classification and organization
                 document_mapping = self._organize_uploaded_documents(uploaded_files)
-                
+
                 # Processing options
                 processing_options = self._render_processing_options()
-                
+
                 # Final review and submit
                 if st.button("🚀 Process All Documents", type="primary", use_container_width=True):
                     if self._validate_submission(borrower_info, document_mapping):
                         self._process_application_batch(
-                            application_id, uploaded_files, document_mapping, 
+                            application_id, uploaded_files, document_mapping,
                             borrower_info, processing_options
                         )
-    
+
     def _render_progress_steps(self):
         """Render progress steps indicator"""
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown("**1. 📋 Information**")
-            st.markdown("✅ Current Step")
-        
-        with col2:
-            st.markdown("**2. 📎 Upload**")
-            st.markdown("⏳ Next")
-        
-        with col3:
-            st.markdown("**3. 🔍 Review**")
-            st.markdown("⏳ Pending")
-        
-        with col4:
-            st.markdown("**4. ✨ Processing**")
-            st.markdown("⏳ Pending")
+
+        st.markdown(_PROGRESS_STEPS_MD)
     
     def _collect_borrower_information(self) -> Dict[str, Any]:
         """Collect borrower information"""
@@ -191,29 +273,34 @@ class MortgageUploadInterface:
         if uploaded_files:
             st.success(f"📁 {len(uploaded_files)} files selected")
             
-            # Show file summary
+            # Validate all files concurrently (I/O-bound reads release the
+            # GIL) so 20 uploads don't block the UI for the sum of their
+            # validation times; rendering stays on the main thread
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
+                validations = list(executor.map(_validate_uploaded_file, uploaded_files))
+
+            # Show file summary as one dataframe: a single websocket delta
+            # instead of ~7 widget deltas per file
             with st.expander("📄 Uploaded Files Summary", expanded=True):
-                for i, file in enumerate(uploaded_files, 1):
-                    file_icon = get_file_icon(file.name.split('.')[-1])
-                    file_size_mb = len(file.getbuffer()) / (1024 * 1024)
-                    
-                    col1, col2, col3 = st.columns([3, 1, 1])
-                    
-                    with col1:
-                        st.markdown(f"{file_icon} **{file.name}**")
-                    
-                    with col2:
-                        st.markdown(f"{file_size_mb:.1f} MB")
-                    
-                    with col3:
-                        # Validation status
-                        validation = validate_file_upload(file)
-                        if validation['is_valid']:
-                            st.success("✅ Valid")
-                        else:
-                            st.error("❌ Issues")
-                            for error in validation['errors']:
-                                st.caption(f"⚠️ {error}")
+                rows = []
+                for file, validation in zip(uploaded_files, validations):
+                    file_icon = get_file_icon(file.name.rsplit('.', 1)[-1].lower())
+                    # file.size is an O(1) attribute; getbuffer() would
+                    # materialize the whole buffer on every rerun just for a label
+                    file_size_mb = file.size / (1024 * 1024)
+
+                    if validation['is_valid']:
+                        status = "✅ Valid"
+                    else:
+                        status = "❌ " + "; ".join(validation['errors'])
+
+                    rows.append({
+                        'File': f"{file_icon} {file.name}",
+                        'Size (MB)': round(file_size_mb, 1),
+                        'Status': status
+                    })
+
+                st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
         
         return uploaded_files
     
@@ -224,26 +311,40 @@ class MortgageUploadInterface:
         st.markdown("Help us identify your documents for better processing:")
         
         document_mapping = {}
-        
+
+        # Suggestions are deterministic per filename; memoize them across
+        # reruns and compute them all in one pass before the render loop so
+        # the widget-building code below is a plain list index
+        suggest_cache = st.session_state.setdefault('_suggest_cache', {})
+        suggestions = [
+            suggest_cache.get(f.name)
+            or suggest_cache.setdefault(f.name, self._suggest_document_type(f.name))
+            for f in uploaded_files
+        ]
+
+        # Compute the options list and its index lookup once, not per file
+        doc_type_keys = list(DOCUMENT_TYPES.keys())
+        doc_type_index = {key: index for index, key in enumerate(doc_type_keys)}
+
         # Create columns for better layout
         for i, uploaded_file in enumerate(uploaded_files):
             with st.container():
                 col1, col2 = st.columns([2, 1])
                 
                 with col1:
-                    file_icon = get_file_icon(uploaded_file.name.split('.')[-1])
+                    file_icon = get_file_icon(uploaded_file.name.rsplit('.', 1)[-1].lower())
                     st.markdown(f"{file_icon} **{uploaded_file.name}**")
                 
                 with col2:
                     # Auto-suggest document type based on filename
-                    suggested_type = self._suggest_document_type(uploaded_file.name)
+                    suggested_type = suggestions[i]
                     
                     doc_type = st.selectbox(
                         "Document Type",
-                        options=list(DOCUMENT_TYPES.keys()),
-                        index=list(DOCUMENT_TYPES.keys()).index(suggested_type) if suggested_type in DOCUMENT_TYPES else 0,
+                        options=doc_type_keys,
+                        index=doc_type_index.get(suggested_type, 0),
                         key=f"doc_type_{i}",
-                        format_func=lambda x: DOCUMENT_TYPES[x]['name']
+                        format_func=_DOC_NAME_BY_KEY.__getitem__
                     )
                     
                     document_mapping[uploaded_file.name] = doc_type
@@ -253,23 +354,16 @@ class MortgageUploadInterface:
     def _suggest_document_type(self, filename: str) -> str:
         """Suggest document type based on filename"""
         
-        filename_lower = filename.lower()
-        
-        # Simple keyword matching
-        if any(term in filename_lower for term in ['payslip', 'salary', 'pay_stub', 'wage']):
-            return 'payslip'
-        elif any(term in filename_lower for term in ['bank', 'statement', 'account']):
-            return 'bank_statement'
-        elif any(term in filename_lower for term in ['id', 'passport', 'license', 'identity']):
-            return 'id_proof'
-        elif any(term in filename_lower for term in ['tax', '1040', 'return', 'w2']):
-            return 'tax_document'
-        elif any(term in filename_lower for term in ['employment', 'job', 'work']):
-            return 'employment_letter'
-        elif any(term in filename_lower for term in ['utility', 'electric', 'gas', 'water']):
-            return 'utility_bill'
-        else:
-            return 'payslip'  # Default
+        # Scan once, then resolve multiple keyword hits by type priority
+        # (declaration order) rather than leftmost position
+        best = None
+        for match in _DOC_TYPE_RE.finditer(filename.lower()):
+            rank = _DOC_TYPE_RANK[match.lastgroup]
+            if best is None or rank < best[0]:
+                if rank == 0:
+                    return match.lastgroup
+                best = (rank, match.lastgroup)
+        return best[1] if best else 'payslip'  # Default
     
     def _render_processing_options(self) -> Dict[str, bool]:
         """Render processing options"""
@@ -324,16 +418,15 @@ class MortgageUploadInterface:
                 field_name = field.replace('_', ' ').title()
                 errors.append(f"{field_name} is required")
         
-        # Validate email format
-        if borrower_info.get('borrower_email'):
-            import re
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, borrower_info['borrower_email']):
-                errors.append("Please enter a valid email address")
+        # Validate email format; cheap membership checks reject obviously
+        # malformed input before the regex runs
+        email = borrower_info.get('borrower_email')
+        if email and ('@' not in email or '.' not in email or not _EMAIL_RE.match(email)):
+            errors.append("Please enter a valid email address")
         
         # Check for required documents
         uploaded_types = set(document_mapping.values())
-        missing_required = set(MANDATORY_DOCUMENTS) - uploaded_types
+        missing_required = MANDATORY_DOCUMENTS_SET - uploaded_types
         
         if missing_required:
             missing_names = [DOCUMENT_TYPES[doc_type]['name'] for doc_type in missing_required]
@@ -366,18 +459,39 @@ class MortgageUploadInterface:
             
             # Update progress
             status_text.text("Starting batch processing...")
-            overall_progress.progress(10)
-            
+            overall_progress.progress(5)
+
+            # The worker thread only records progress; the main thread polls
+            # and owns every st.* call, so the UI stays responsive instead of
+            # blocking for the whole synchronous batch
+            progress_state = {'completed': 0, 'total': max(len(uploaded_files), 1)}
+
+            def _record_progress(completed: int, total: int):
+                progress_state['completed'] = completed
+                progress_state['total'] = total
+
             try:
-                # Process the batch
-                batch_result = self.batch_processor.process_application_batch(
-                    application_id=application_id,
-                    uploaded_files=uploaded_files,
-                    document_types=document_mapping,
-                    borrower_info=borrower_info,
-                    processing_options=processing_options
-                )
-                
+                # Process the batch on a background thread
+                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(
+                        self.batch_processor.process_application_batch,
+                        application_id=application_id,
+                        uploaded_files=uploaded_files,
+                        document_types=document_mapping,
+                        borrower_info=borrower_info,
+                        processing_options=processing_options,
+                        progress_callback=_record_progress
+                    )
+
+                    while not future.done():
+                        completed = progress_state['completed']
+                        total = progress_state['total']
+                        overall_progress.progress(min(5 + int(90 * completed / total), 95))
+                        status_text.text(f"Processed {completed}/{total} documents...")
+                        time.sleep(0.2)
+
+                    batch_result = future.result()
+
                 # Update progress
                 overall_progress.progress(100)
                 status_text.text("✅ Processing completed!")
@@ -466,8 +580,6 @@ class MortgageUploadInterface:
     def _generate_application_id(self) -> str:
         """Generate a unique application ID"""
         
-        # Format: APP-MMDD-XXXXXXXX
-        timestamp = datetime.now().strftime("%m%d")
-        unique_part = str(uuid.uuid4())[:8].upper()
-        
-        return f"APP-{timestamp}-{unique_part}"
\ No newline at end of file
+        # Format: APP-MMDD-XXXXXXXX. token_hex(4) yields exactly 8 hex chars
+        # without formatting (and then slicing) a full 36-char UUID
+        return f"APP-{datetime.now():%m%d}-{secrets.token_hex(4).upper()}"
\ No newline at end of file
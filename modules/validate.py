@@ -1,264 +1,361 @@
 import re
+import sys
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from itertools import groupby
+from typing import Dict, Any, List, Optional, Tuple
 from utils.document_types import DOCUMENT_TYPES, VALIDATION_RULES
 
+# Patterns compiled once at import; the helpers below run per document per
+# field, and re's internal cache still costs a lookup and lock per call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_DATE_CLEAN_RE = re.compile(r'[^\w\s/-]')
+_NUMERIC_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# Deletion tables for str.translate: a single C-level pass replaces the
+# regex engine for the plain character strips below
+_NONDIGIT_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isdigit()))
+_CURRENCY_TABLE = str.maketrans('', '', '$,€£¥')
+
+# Shape-classifying dispatcher: one match decides which strptime format(s)
+# apply, instead of raising ValueError through a twelve-format loop.
+# Ambiguous shapes list formats in the same precedence the old loop used.
+_DATE_DISPATCH = re.compile(
+    r'(?P<mdy_slash>\d{1,2}/\d{1,2}/\d{4})'
+    r'|(?P<ymd_slash>\d{4}/\d{1,2}/\d{1,2})'
+    r'|(?P<mdy_dash>\d{1,2}-\d{1,2}-\d{4})'
+    r'|(?P<dmy_text>\d{1,2}\s+[A-Za-z]+\s+\d{4})'
+    r'|(?P<dmy_text_dash>\d{1,2}-[A-Za-z]+-\d{4})'
+)
+
+_DATE_FORMATS_BY_GROUP = {
+    'dmy_text': ('%d %b %Y', '%d %B %Y'),
+    'dmy_text_dash': ('%d-%b-%Y', '%d-%B-%Y'),
+}
+
+# Field-name groups checked per document; frozensets allow one keys()
+# intersection instead of k separate membership probes per check
+_PAYSLIP_SALARY_FIELDS = frozenset({'gross_salary', 'net_salary', 'basic_salary', 'gross_pay', 'net_pay'})
+_PAYSLIP_EMPLOYER_FIELDS = frozenset({'employer_name', 'company', 'company_name'})
+_BANK_ACCOUNT_FIELDS = frozenset({'account_number', 'account'})
+_BANK_BALANCE_FIELDS = frozenset({'account_balance', 'balance', 'closing_balance'})
+_BANK_NAME_FIELDS = frozenset({'bank_name', 'bank', 'financial_institution'})
+_ID_NAME_FIELDS = frozenset({'full_name', 'name', 'first_name', 'last_name'})
+_ID_NUMBER_FIELDS = frozenset({'id_number', 'license_number', 'passport_number', 'ssn'})
+_ID_EXPIRY_FIELDS = frozenset({'expiry_date', 'expiration_date', 'valid_until'})
+
+# Application-level document requirements
+_REQUIRED_DOC_TYPES = frozenset({'id_proof', 'payslip', 'bank_statement', 'employment_letter'})
+_OPTIONAL_DOC_TYPES = frozenset({'tax_document', 'utility_bill', 'property_document'})
+
+# Display strings and month counts computed once, not per failed check
+_DOC_PLAIN = {k: k.replace('_', ' ') for k in (
+    'payslip', 'bank_statement', 'utility_bill', 'employment_letter',
+    'tax_document', 'id_proof', 'property_document'
+)}
+_DOC_DISPLAY = {k: v.title() for k, v in _DOC_PLAIN.items()}
+_DOC_MONTHS = {'payslip': 3, 'bank_statement': 3, 'utility_bill': 3,
+               'employment_letter': 6, 'tax_document': 12}
+
+
+def _score(n_issues: int, n_warnings: int, n_missing: int) -> float:
+    """Validation score from finding counts: pure arithmetic on ints"""
+    return max(0.0, 1.0 - 0.2 * n_issues - 0.1 * n_warnings - 0.15 * n_missing)
+
+
+def _unwrap(value: Any) -> Any:
+    """Unwrap {'value': ...} extraction cells to their raw value"""
+    return value.get('value', value) if isinstance(value, dict) else value
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Mutable per-document validation state
+
+    The helpers append to these attributes directly; slot access avoids the
+    string-keyed dict hashing the old result dict paid on every mutation.
+    to_dict() restores the shape callers and stored processing results expect.
+    """
+    is_valid: bool = True
+    issues: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    validation_score: float = 0.0
+    missing_fields: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'is_valid': self.is_valid,
+            'issues': self.issues,
+            'warnings': self.warnings,
+            'validation_score': self.validation_score,
+            'missing_fields': self.missing_fields,
+            'recommendations': self.recommendations
+        }
+
 class DocumentValidator:
+    # Maximum document age in days, shared across calls instead of being
+    # rebuilt per validation
+    _RECENCY_RULES = {
+        'payslip': 90,  # 3 months
+        'bank_statement': 90,  # 3 months
+        'utility_bill': 90,  # 3 months
+        'employment_letter': 180,  # 6 months
+        'tax_document': 365  # 1 year
+    }
+
     def __init__(self):
         self.validation_rules = VALIDATION_RULES
-    
-    def validate_document(self, extraction_result: Dict[str, Any], document_type: str) -> Dict[str, Any]:
-        """Validate extracted document data"""
-        
-        validation_result = {
-            'is_valid': True,
-            'issues': [],
-            'warnings': [],
-            'validation_score': 0.0,
-            'missing_fields': [],
-            'recommendations': []
+        # Bound-method dispatch: one dict lookup per document instead of a
+        # string-equality cascade, and new types just add an entry
+        self._type_validators = {
+            'payslip': self._validate_payslip,
+            'bank_statement': self._validate_bank_statement,
+            'id_proof': self._validate_id_proof,
+            'tax_document': self._validate_tax_document
         }
-        
+    
+    def validate_document(self, extraction_result: Dict[str, Any], document_type: str,
+                          as_of: Optional[datetime] = None) -> Dict[str, Any]:
+        """Validate extracted document data
+
+        as_of lets batch callers pin one timestamp for a whole run instead of
+        paying a clock read per document; it defaults to now.
+        """
+
+        validation_result = ValidationResult()
+
         try:
+            if as_of is None:
+                as_of = datetime.now()
+
+            # Type strings arrive from the UI/database; interning makes every
+            # downstream dict probe on them a pointer compare
+            document_type = sys.intern(document_type)
+
+            # Bind structured_data once; every helper below works from it
+            structured_data = extraction_result.get('structured_data') or {}
+
             # Get document-specific validation rules
             rules = self.validation_rules.get(document_type, {})
-            
+
             # Validate required fields
-            self._validate_required_fields(extraction_result, rules, validation_result)
-            
+            self._validate_required_fields(structured_data, rules, validation_result)
+
             # Validate document recency
-            self._validate_document_recency(extraction_result, document_type, validation_result)
-            
+            self._validate_document_recency(structured_data, document_type, validation_result, as_of)
+
             # Validate data formats
-            self._validate_data_formats(extraction_result, document_type, validation_result)
-            
+            self._validate_data_formats(structured_data, validation_result)
+
             # Document-specific validations
-            if document_type == 'payslip':
-                self._validate_payslip(extraction_result, validation_result)
-            elif document_type == 'bank_statement':
-                self._validate_bank_statement(extraction_result, validation_result)
-            elif document_type == 'id_proof':
-                self._validate_id_proof(extraction_result, validation_result)
-            elif document_type == 'tax_document':
-                self._validate_tax_document(extraction_result, validation_result)
+            type_validator = self._type_validators.get(document_type)
+            if type_validator is not None:
+                type_validator(structured_data, validation_result, as_of)
             
             # Calculate overall validation score
-            validation_result['validation_score'] = self._calculate_validation_score(validation_result)
-            
+            validation_result.validation_score = self._calculate_validation_score(validation_result)
+
             # Set overall validity
-            validation_result['is_valid'] = (
-                len(validation_result['issues']) == 0 and
-                validation_result['validation_score'] >= 0.7
+            validation_result.is_valid = (
+                len(validation_result.issues) == 0 and
+                validation_result.validation_score >= 0.7
             )
-            
+
         except Exception as e:
-            logging.error(f"Document validation failed: {str(e)}")
-            validation_result['issues'].append(f"Validation error: {str(e)}")
-            validation_result['is_valid'] = False
-        
-        return validation_result
-    
-    def _validate_required_fields(self, extraction_result: Dict[str, Any], 
-                                rules: Dict[str, Any], validation_result: Dict[str, Any]):
+            # %-style defers message formatting until a handler actually emits
+            logging.exception("Document validation failed for type %s", document_type)
+            validation_result.issues.append(f"Validation error: {str(e)}")
+            validation_result.is_valid = False
+
+        return validation_result.to_dict()
+
+    def validate_documents(self, batch: List[Tuple[Dict[str, Any], str]]) -> List[Dict[str, Any]]:
+        """Validate a batch of (extraction_result, document_type) pairs
+
+        Groups the batch by document type so each type-specific validation
+        path runs over its documents back to back (warm branch and constant
+        lookups), and pins one timestamp for the whole run. Results come back
+        in the original batch order.
+        """
+
+        as_of = datetime.now()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+
+        order = sorted(range(len(batch)), key=lambda i: batch[i][1])
+        for document_type, indices in groupby(order, key=lambda i: batch[i][1]):
+            for i in indices:
+                results[i] = self.validate_document(batch[i][0], document_type, as_of=as_of)
+
+        return results
+
+    def _validate_required_fields(self, structured_data: Dict[str, Any],
+                                rules: Dict[str, Any], validation_result: ValidationResult):
         """Validate that required fields are present"""
-        
+
         required_fields = rules.get('required_fields', [])
-        structured_data = extraction_result.get('structured_data', {})
-        
+
         for field in required_fields:
             if field not in structured_data or not structured_data[field]:
-                validation_result['missing_fields'].append(field)
-                validation_result['issues'].append(f"Missing required field: {field}")
+                validation_result.missing_fields.append(field)
+                validation_result.issues.append(f"Missing required field: {field}")
     
-    def _validate_document_recency(self, extraction_result: Dict[str, Any], 
-                                 document_type: str, validation_result: Dict[str, Any]):
+    def _validate_document_recency(self, structured_data: Dict[str, Any],
+                                 document_type: str, validation_result: ValidationResult,
+                                 as_of: Optional[datetime] = None):
         """Validate document recency requirements"""
         
-        recency_rules = {
-            'payslip': 90,  # 3 months
-            'bank_statement': 90,  # 3 months
-            'utility_bill': 90,  # 3 months
-            'employment_letter': 180,  # 6 months
-            'tax_document': 365  # 1 year
-        }
-        
-        max_age_days = recency_rules.get(document_type)
+        max_age_days = self._RECENCY_RULES.get(document_type)
         if not max_age_days:
             return
         
-        # Find dates in the document
-        dates_found = self._extract_dates(extraction_result)
-        
-        if not dates_found:
-            validation_result['warnings'].append(
+        current_date = as_of if as_of is not None else datetime.now()
+        cutoff_date = current_date - timedelta(days=max_age_days)
+
+        # One lazy pass over the document's dates: stop at the first date
+        # that is recent enough instead of collecting and re-parsing a list
+        date_found = False
+        recent_enough = False
+        for doc_date in self._iter_parsed_dates(structured_data):
+            date_found = True
+            if doc_date >= cutoff_date:
+                recent_enough = True
+                break
+
+        if not date_found:
+            validation_result.warnings.append(
                 f"No date found in {document_type}. Manual verification required."
             )
             return
-        
-        # Check if any date is recent enough
-        recent_enough = False
-        current_date = datetime.now()
-        cutoff_date = current_date - timedelta(days=max_age_days)
-        
-        for date_str in dates_found:
-            try:
-                doc_date = self._parse_date(date_str)
-                if doc_date and doc_date >= cutoff_date:
-                    recent_enough = True
-                    break
-            except:
-                continue
-        
+
         if not recent_enough:
-            validation_result['issues'].append(
-                f"{document_type.replace('_', ' ').title()} is older than {max_age_days} days. "
+            validation_result.issues.append(
+                f"{_DOC_DISPLAY[document_type]} is older than {max_age_days} days. "
                 f"Please provide a more recent document."
             )
-            validation_result['recommendations'].append(
-                f"Upload a {document_type.replace('_', ' ')} from the last {max_age_days // 30} month(s)"
+            validation_result.recommendations.append(
+                f"Upload a {_DOC_PLAIN[document_type]} from the last {_DOC_MONTHS[document_type]} month(s)"
             )
     
-    def _validate_data_formats(self, extraction_result: Dict[str, Any], 
-                             document_type: str, validation_result: Dict[str, Any]):
+    def _validate_data_formats(self, structured_data: Dict[str, Any],
+                             validation_result: ValidationResult):
         """Validate data format consistency"""
-        
-        structured_data = extraction_result.get('structured_data', {})
-        
-        # Validate email format if present
-        for field, value in structured_data.items():
-            if 'email' in field.lower() and isinstance(value, (str, dict)):
-                email_value = value.get('value', value) if isinstance(value, dict) else value
+
+        # One pass lowercases each key once and buckets the candidates, so
+        # documents without email/phone fields skip the format checks entirely
+        email_keys = []
+        phone_keys = []
+        for field in structured_data:
+            lowered = field.lower()
+            if 'email' in lowered:
+                email_keys.append(field)
+            elif 'phone' in lowered:
+                phone_keys.append(field)
+
+        for field in email_keys:
+            value = structured_data[field]
+            if isinstance(value, (str, dict)):
+                email_value = _unwrap(value)
                 if email_value and not self._is_valid_email(email_value):
-                    validation_result['warnings'].append(f"Invalid email format: {email_value}")
-            
-            # Validate phone format if present
-            elif 'phone' in field.lower() and isinstance(value, (str, dict)):
-                phone_value = value.get('value', value) if isinstance(value, dict) else value
+                    validation_result.warnings.append(f"Invalid email format: {email_value}")
+
+        for field in phone_keys:
+            value = structured_data[field]
+            if isinstance(value, (str, dict)):
+                phone_value = _unwrap(value)
                 if phone_value and not self._is_valid_phone(phone_value):
-                    validation_result['warnings'].append(f"Invalid phone format: {phone_value}")
+                    validation_result.warnings.append(f"Invalid phone format: {phone_value}")
     
-    def _validate_payslip(self, extraction_result: Dict[str, Any], validation_result: Dict[str, Any]):
+    def _validate_payslip(self, structured_data: Dict[str, Any], validation_result: ValidationResult,
+                          as_of: Optional[datetime] = None):
         """Validate payslip-specific requirements"""
-        
-        structured_data = extraction_result.get('structured_data', {})
-        
+
+        keys = structured_data.keys()
+
         # Check for salary information
-        salary_fields = ['gross_salary', 'net_salary', 'basic_salary', 'gross_pay', 'net_pay']
-        salary_found = any(field in structured_data for field in salary_fields)
-        
-        if not salary_found:
-            validation_result['issues'].append("No salary information found in payslip")
-        
+        salary_hits = keys & _PAYSLIP_SALARY_FIELDS
+
+        if not salary_hits:
+            validation_result.issues.append("No salary information found in payslip")
+
         # Check for employer information
-        employer_fields = ['employer_name', 'company', 'company_name']
-        employer_found = any(field in structured_data for field in employer_fields)
-        
-        if not employer_found:
-            validation_result['warnings'].append("Employer information not clearly identified")
-        
+        if not keys & _PAYSLIP_EMPLOYER_FIELDS:
+            validation_result.warnings.append("Employer information not clearly identified")
+
         # Validate salary amounts are reasonable
-        for field in salary_fields:
-            if field in structured_data:
-                salary_value = structured_data[field]
-                if isinstance(salary_value, dict):
-                    salary_value = salary_value.get('value', '')
-                
-                # Extract numeric value from salary
-                numeric_salary = self._extract_numeric_value(str(salary_value))
-                if numeric_salary:
-                    if numeric_salary < 100:  # Unreasonably low
-                        validation_result['warnings'].append(f"Salary amount seems unusually low: {salary_value}")
-                    elif numeric_salary > 1000000:  # Unreasonably high
-                        validation_result['warnings'].append(f"Salary amount seems unusually high: {salary_value}")
+        for field in salary_hits:
+            salary_value = _unwrap(structured_data[field])
+
+            # Extract numeric value from salary. One chained range test takes
+            # the predictable in-range path on typical payslips; the branch to
+            # pick low vs high only runs for outliers
+            numeric_salary = self._extract_numeric_value(str(salary_value))
+            if numeric_salary and not 100 <= numeric_salary <= 1000000:
+                bound = 'low' if numeric_salary < 100 else 'high'
+                validation_result.warnings.append(f"Salary amount seems unusually {bound}: {salary_value}")
     
-    def _validate_bank_statement(self, extraction_result: Dict[str, Any], validation_result: Dict[str, Any]):
+    def _validate_bank_statement(self, structured_data: Dict[str, Any], validation_result: ValidationResult,
+                                 as_of: Optional[datetime] = None):
         """Validate bank statement-specific requirements"""
-        
-        structured_data = extraction_result.get('structured_data', {})
-        
+
+        keys = structured_data.keys()
+
         # Check for account information
-        account_fields = ['account_number', 'account']
-        account_found = any(field in structured_data for field in account_fields)
-        
-        if not account_found:
-            validation_result['issues'].append("Account number not found in bank statement")
-        
+        if not keys & _BANK_ACCOUNT_FIELDS:
+            validation_result.issues.append("Account number not found in bank statement")
+
         # Check for balance information
-        balance_fields = ['account_balance', 'balance', 'closing_balance']
-        balance_found = any(field in structured_data for field in balance_fields)
-        
-        if not balance_found:
-            validation_result['warnings'].append("Account balance information not clearly identified")
-        
+        if not keys & _BANK_BALANCE_FIELDS:
+            validation_result.warnings.append("Account balance information not clearly identified")
+
         # Check for bank name
-        bank_fields = ['bank_name', 'bank', 'financial_institution']
-        bank_found = any(field in structured_data for field in bank_fields)
-        
-        if not bank_found:
-            validation_result['warnings'].append("Bank name not clearly identified")
+        if not keys & _BANK_NAME_FIELDS:
+            validation_result.warnings.append("Bank name not clearly identified")
     
-    def _validate_id_proof(self, extraction_result: Dict[str, Any], validation_result: Dict[str, Any]):
+    def _validate_id_proof(self, structured_data: Dict[str, Any], validation_result: ValidationResult,
+                           as_of: Optional[datetime] = None):
         """Validate ID proof-specific requirements"""
-        
-        structured_data = extraction_result.get('structured_data', {})
-        
+
+        keys = structured_data.keys()
+
         # Check for name
-        name_fields = ['full_name', 'name', 'first_name', 'last_name']
-        name_found = any(field in structured_data for field in name_fields)
-        
-        if not name_found:
-            validation_result['issues'].append("Name not found in ID document")
-        
+        if not keys & _ID_NAME_FIELDS:
+            validation_result.issues.append("Name not found in ID document")
+
         # Check for ID number
-        id_fields = ['id_number', 'license_number', 'passport_number', 'ssn']
-        id_found = any(field in structured_data for field in id_fields)
-        
-        if not id_found:
-            validation_result['issues'].append("ID number not found in document")
-        
-        # Check for expiry date
-        expiry_fields = ['expiry_date', 'expiration_date', 'valid_until']
-        expiry_found = any(field in structured_data for field in expiry_fields)
-        
-        if expiry_found:
-            # Validate that ID is not expired
-            for field in expiry_fields:
-                if field in structured_data:
-                    expiry_value = structured_data[field]
-                    if isinstance(expiry_value, dict):
-                        expiry_value = expiry_value.get('value', '')
-                    
-                    try:
-                        expiry_date = self._parse_date(str(expiry_value))
-                        if expiry_date and expiry_date < datetime.now():
-                            validation_result['issues'].append("ID document has expired")
-                            break
-                    except:
-                        continue
+        if not keys & _ID_NUMBER_FIELDS:
+            validation_result.issues.append("ID number not found in document")
+
+        # Check for expiry date and validate that the ID is not expired
+        for field in keys & _ID_EXPIRY_FIELDS:
+            expiry_value = _unwrap(structured_data[field])
+            if not expiry_value:
+                continue
+
+            try:
+                expiry_date = self._parse_date(str(expiry_value))
+                if expiry_date and expiry_date < (as_of if as_of is not None else datetime.now()):
+                    validation_result.issues.append("ID document has expired")
+                    break
+            except (ValueError, TypeError):
+                continue
     
-    def _validate_tax_document(self, extraction_result: Dict[str, Any], validation_result: Dict[str, Any]):
+    def _validate_tax_document(self, structured_data: Dict[str, Any], validation_result: ValidationResult,
+                               as_of: Optional[datetime] = None):
         """Validate tax document-specific requirements"""
-        
-        structured_data = extraction_result.get('structured_data', {})
-        
+
         # Check for tax year
-        dates_found = self._extract_dates(extraction_result)
-        current_year = datetime.now().year
-        
+        current_year = (as_of if as_of is not None else datetime.now()).year
+
         # Tax documents should be from recent years (within 3 years)
-        valid_year_found = False
-        for date_str in dates_found:
-            try:
-                date_obj = self._parse_date(date_str)
-                if date_obj and date_obj.year >= current_year - 3:
-                    valid_year_found = True
-                    break
-            except:
-                continue
-        
+        valid_year_found = any(
+            date_obj.year >= current_year - 3
+            for date_obj in self._iter_parsed_dates(structured_data)
+        )
+
         if not valid_year_found:
-            validation_result['warnings'].append("Tax document year could not be verified")
+            validation_result.warnings.append("Tax document year could not be verified")
     
     def _extract_dates(self, extraction_result: Dict[str, Any]) -> List[str]:
         """Extract all dates found in the document"""
@@ -278,7 +375,28 @@ class DocumentValidator:
             dates.extend(structured_data['dates_found'])
         
         return dates
-    
+
+    def _iter_parsed_dates(self, structured_data: Dict[str, Any]):
+        """Lazily yield parsed datetimes found in the document
+
+        Walks structured_data once, parsing as it goes, so callers that only
+        need one qualifying date can short-circuit without building and then
+        re-iterating the intermediate string list from _extract_dates.
+        """
+
+        for field, value in structured_data.items():
+            if 'date' in field.lower():
+                date_value = _unwrap(value)
+                if date_value:
+                    parsed = self._parse_date(str(date_value))
+                    if parsed is not None:
+                        yield parsed
+
+        for date_str in structured_data.get('dates_found', ()):
+            parsed = self._parse_date(str(date_str))
+            if parsed is not None:
+                yield parsed
+
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string into datetime object"""
         
@@ -290,36 +408,82 @@ class DocumentValidator:
         ]
         
         # Clean the date string
-        date_str = re.sub(r'[^\w\s/-]', '', date_str.strip())
-        
+        date_str = _DATE_CLEAN_RE.sub('', date_str.strip())
+
+        # Obviously non-date strings don't deserve twelve strptime attempts:
+        # every supported format is 6-32 chars with at least a 4-digit year
+        if not 6 <= len(date_str) <= 32 or sum(c.isdigit() for c in date_str) < 4:
+            return None
+
+        # Fast path: OCR pipelines mostly emit ISO-8601, and fromisoformat is
+        # a C-level parse with no exception churn on the common case. Strip
+        # any timezone so callers always get naive datetimes — recency checks
+        # compare against naive cutoffs
+        try:
+            return datetime.fromisoformat(date_str.replace('Z', '+00:00')).replace(tzinfo=None)
+        except ValueError:
+            pass
+
+        # Classify the shape once and try only the matching format(s)
+        match = _DATE_DISPATCH.fullmatch(date_str)
+        if match:
+            group = match.lastgroup
+
+            # Purely numeric shapes skip strptime entirely: split the fields
+            # and construct the datetime directly. Month-first keeps
+            # precedence; an impossible month (e.g. 25/12/2024) raises and
+            # falls through to the day-first reading
+            if group in ('mdy_slash', 'mdy_dash', 'ymd_slash'):
+                a, b, c = (int(p) for p in date_str.replace('-', '/').split('/'))
+                candidates = ((a, b, c),) if group == 'ymd_slash' else ((c, a, b), (c, b, a))
+                for year, month, day in candidates:
+                    try:
+                        return datetime(year, month, day)
+                    except ValueError:
+                        continue
+                return None
+
+            for fmt in _DATE_FORMATS_BY_GROUP[group]:
+                try:
+                    return datetime.strptime(date_str, fmt)
+                except ValueError:
+                    continue
+
+        # Last-ditch fallback for shapes the dispatcher doesn't know
         for fmt in date_formats:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
                 continue
-        
+
         return None
     
     def _is_valid_email(self, email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email.strip()) is not None
-    
+        # Cheap structural checks reject malformed input before the regex runs
+        email = email.strip()
+        if '@' not in email:
+            return False
+        local, _, domain = email.rpartition('@')
+        if not local or '.' not in domain:
+            return False
+        return _EMAIL_RE.match(email) is not None
+
     def _is_valid_phone(self, phone: str) -> bool:
         """Validate phone format"""
         # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = phone.translate(_NONDIGIT_TABLE)
         # Phone should have 10-15 digits
         return 10 <= len(digits_only) <= 15
-    
+
     def _extract_numeric_value(self, value_str: str) -> Optional[float]:
         """Extract numeric value from string"""
-        
+
         # Remove currency symbols and commas
-        cleaned = re.sub(r'[\$,€£¥]', '', value_str)
-        
+        cleaned = value_str.translate(_CURRENCY_TABLE)
+
         # Find numeric value
-        match = re.search(r'\d+(?:\.\d+)?', cleaned)
+        match = _NUMERIC_RE.search(cleaned)
         if match:
             try:
                 return float(match.group())
@@ -328,37 +492,18 @@ class DocumentValidator:
         
         return None
     
-    def _calculate_validation_score(self, validation_result: Dict[str, Any]) -> float:
+    def _calculate_validation_score(self, validation_result: ValidationResult) -> float:
         """Calculate overall validation score"""
-        
-        base_score = 1.0
-        
-        # Deduct for issues
-        issue_penalty = len(validation_result['issues']) * 0.2
-        warning_penalty = len(validation_result['warnings']) * 0.1
-        missing_field_penalty = len(validation_result['missing_fields']) * 0.15
-        
-        total_penalty = issue_penalty + warning_penalty + missing_field_penalty
-        final_score = max(0.0, base_score - total_penalty)
-        
-        return final_score
+
+        return _score(
+            len(validation_result.issues),
+            len(validation_result.warnings),
+            len(validation_result.missing_fields)
+        )
 
     def validate_application_completeness(self, application_documents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate that all required documents for mortgage application are present"""
         
-        required_doc_types = [
-            'id_proof',
-            'payslip',
-            'bank_statement',
-            'employment_letter'
-        ]
-        
-        optional_doc_types = [
-            'tax_document',
-            'utility_bill',
-            'property_document'
-        ]
-        
         completeness_result = {
             'is_complete': True,
             'missing_required': [],
@@ -367,29 +512,22 @@ class DocumentValidator:
             'completeness_score': 0.0
         }
         
-        # Get list of uploaded document types
-        uploaded_types = [doc.get('document_type') for doc in application_documents]
-        
-        # Check required documents
-        for req_type in required_doc_types:
-            if req_type not in uploaded_types:
-                completeness_result['missing_required'].append(req_type)
-                completeness_result['is_complete'] = False
-        
-        # Check optional documents
-        for opt_type in optional_doc_types:
-            if opt_type not in uploaded_types:
-                completeness_result['missing_optional'].append(opt_type)
-        
+        # Set differences replace the per-type membership scans
+        uploaded_types = {doc.get('document_type') for doc in application_documents}
+
+        completeness_result['missing_required'] = sorted(_REQUIRED_DOC_TYPES - uploaded_types)
+        completeness_result['missing_optional'] = sorted(_OPTIONAL_DOC_TYPES - uploaded_types)
+        completeness_result['is_complete'] = not completeness_result['missing_required']
+
         # Generate recommendations
         for missing in completeness_result['missing_required']:
-            doc_name = missing.replace('_', ' ').title()
+            doc_name = _DOC_DISPLAY[missing]
             completeness_result['recommendations'].append(
                 f"Please upload your {doc_name} to complete your application"
             )
         
         # Calculate completeness score
-        total_required = len(required_doc_types)
+        total_required = len(_REQUIRED_DOC_TYPES)
         uploaded_required = total_required - len(completeness_result['missing_required'])
         completeness_result['completeness_score'] = uploaded_required / total_required
         
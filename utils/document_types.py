@@ -1,8 +1,16 @@
 """
 Document type definitions and validation rules for mortgage application processing
+
+Use the *_SET constants for membership tests and the sequence forms for
+ordered iteration/display.
 """
 
-from typing import Dict, List, Any
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Iterable, Tuple
 
 # Document type definitions with their requirements
 DOCUMENT_TYPES = {
@@ -98,8 +106,8 @@ DOCUMENT_TYPES = {
     }
 }
 
-# Validation rules for different document types
-VALIDATION_RULES = {
+# Validation rules for different document types (frozen lazily below)
+_VALIDATION_RULES_RAW = {
     'id_proof': {
         'required_fields': ['full_name', 'id_number'],
         'optional_fields': ['date_of_birth', 'address', 'expiry_date'],
@@ -237,8 +245,8 @@ VALIDATION_RULES = {
     }
 }
 
-# Document categories for organization
-DOCUMENT_CATEGORIES = {
+# Document categories for organization (frozen lazily below)
+_DOCUMENT_CATEGORIES_RAW = {
     'identity': {
         'name': 'Identity Verification',
         'description': 'Documents that verify the borrower\'s identity',
@@ -277,20 +285,97 @@ DOCUMENT_CATEGORIES = {
     }
 }
 
+def _freeze(mapping: Dict[str, Any]) -> MappingProxyType:
+    """Recursively wrap dicts in read-only views and lists in tuples"""
+    frozen = {}
+    for key, value in mapping.items():
+        if isinstance(value, dict):
+            frozen[key] = _freeze(value)
+        elif isinstance(value, list):
+            frozen[key] = tuple(value)
+        else:
+            frozen[key] = value
+    return MappingProxyType(frozen)
+
+# These tables are constants; freezing them lets accessors and caches hand
+# out shared references without risking accidental mutation upstream.
+# DOCUMENT_TYPES freezes eagerly since every consumer touches it;
+# VALIDATION_RULES and DOCUMENT_CATEGORIES materialize on first access
+# (PEP 562) so suggestion/priority-only paths skip freezing them.
+DOCUMENT_TYPES = _freeze(DOCUMENT_TYPES)
+
+def __getattr__(name: str):
+    if name == 'VALIDATION_RULES':
+        value = _freeze(_VALIDATION_RULES_RAW)
+    elif name == 'DOCUMENT_CATEGORIES':
+        value = _freeze(_DOCUMENT_CATEGORIES_RAW)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def _validation_rules() -> MappingProxyType:
+    """Frozen rules table, materialized on first use"""
+    try:
+        return globals()['VALIDATION_RULES']
+    except KeyError:
+        return __getattr__('VALIDATION_RULES')
+
+def _document_categories() -> MappingProxyType:
+    """Frozen categories table, materialized on first use"""
+    try:
+        return globals()['DOCUMENT_CATEGORIES']
+    except KeyError:
+        return __getattr__('DOCUMENT_CATEGORIES')
+
+# Shared immutable miss default: no fresh {} allocation per failed lookup
+_EMPTY_RULES = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationRule:
+    """Typed view of one document type's validation rules
+
+    Slot attribute reads replace the chained dict .get()s the field
+    accessors below used to perform per call.
+    """
+    required_fields: Tuple[str, ...] = ()
+    optional_fields: Tuple[str, ...] = ()
+    validation_checks: Tuple[str, ...] = ()
+    quality_requirements: Any = field(default_factory=lambda: _EMPTY_RULES)
+
+
+_DEFAULT_RULE = ValidationRule()
+
+@lru_cache(maxsize=1)
+def _rule_registry() -> Dict[str, ValidationRule]:
+    """Typed registry compiled from the frozen rules on first use"""
+    return {
+        doc_type: ValidationRule(
+            required_fields=rules.get('required_fields', ()),
+            optional_fields=rules.get('optional_fields', ()),
+            validation_checks=rules.get('validation_checks', ()),
+            quality_requirements=rules.get('quality_requirements', _EMPTY_RULES)
+        )
+        for doc_type, rules in _validation_rules().items()
+    }
+
 # Mandatory documents for mortgage application
-MANDATORY_DOCUMENTS = [
+MANDATORY_DOCUMENTS = (
     'id_proof',
     'payslip',
     'bank_statement',
     'employment_letter'
-]
+)
+MANDATORY_DOCUMENTS_SET = frozenset(MANDATORY_DOCUMENTS)
 
 # Optional but recommended documents
-RECOMMENDED_DOCUMENTS = [
+RECOMMENDED_DOCUMENTS = (
     'tax_document',
     'utility_bill',
     'credit_report'
-]
+)
+RECOMMENDED_DOCUMENTS_SET = frozenset(RECOMMENDED_DOCUMENTS)
 
 # Document processing priorities (higher number = higher priority)
 PROCESSING_PRIORITIES = {
@@ -306,120 +391,223 @@ PROCESSING_PRIORITIES = {
     'self_employment_proof': 1
 }
 
+# Reverse indexes built once at import; the accessors below are called per
+# document in validation loops, so they should not rescan DOCUMENT_TYPES
+_CATEGORY_INDEX: Dict[str, tuple] = {}
+for _doc_type, _info in DOCUMENT_TYPES.items():
+    _CATEGORY_INDEX.setdefault(_info['category'], []).append(_doc_type)
+_CATEGORY_INDEX = {category: tuple(doc_types) for category, doc_types in _CATEGORY_INDEX.items()}
+
+# Keys-only set for the membership-only path: smaller table than the full
+# dict, so heavy validate_document_type traffic stays cache-friendly
+_VALID_DOC_TYPES = frozenset(DOCUMENT_TYPES)
+
+# Membership sets for the category predicates below
+_FINANCIAL_DOCS = frozenset(_CATEGORY_INDEX.get('financial', ()))
+_IDENTITY_DOCS = frozenset(_CATEGORY_INDEX.get('identity', ()))
+_INCOME_DOCS = frozenset(_CATEGORY_INDEX.get('income', ()))
+
+_REQUIRED_DOCS = tuple(k for k, v in DOCUMENT_TYPES.items() if v.get('required', False))
+_OPTIONAL_DOCS = tuple(k for k, v in DOCUMENT_TYPES.items() if not v.get('required', True))
+
+# Flat per-attribute tables: one hash lookup per accessor call instead of
+# two chained .get()s with a throwaway empty-dict default
+_CATEGORY = {k: v['category'] for k, v in DOCUMENT_TYPES.items()}
+_REQUIRED = {k: v.get('required', False) for k, v in DOCUMENT_TYPES.items()}
+_MAX_AGE = {k: v.get('max_age_days', 365) for k, v in DOCUMENT_TYPES.items()}
+_FORMATS = {k: tuple(v.get('accepted_formats', ('pdf',))) for k, v in DOCUMENT_TYPES.items()}
+_NAMES = {k: v['name'] for k, v in DOCUMENT_TYPES.items()}
+_DESCRIPTIONS = {k: v.get('description', '') for k, v in DOCUMENT_TYPES.items()}
+_EXAMPLES = {k: v.get('examples', ()) for k, v in DOCUMENT_TYPES.items()}
+
+@lru_cache(maxsize=None)
 def get_document_category(document_type: str) -> str:
     """Get the category of a document type"""
-    doc_info = DOCUMENT_TYPES.get(document_type, {})
-    return doc_info.get('category', 'unknown')
+    return _CATEGORY.get(document_type, 'unknown')
 
 def get_required_documents() -> List[str]:
     """Get list of required document types"""
-    return [doc_type for doc_type, info in DOCUMENT_TYPES.items() if info.get('required', False)]
+    return list(_REQUIRED_DOCS)
 
 def get_optional_documents() -> List[str]:
     """Get list of optional document types"""
-    return [doc_type for doc_type, info in DOCUMENT_TYPES.items() if not info.get('required', True)]
+    return list(_OPTIONAL_DOCS)
 
 def get_documents_by_category(category: str) -> List[str]:
     """Get all document types in a specific category"""
-    return [doc_type for doc_type, info in DOCUMENT_TYPES.items() 
-            if info.get('category') == category]
+    return list(_CATEGORY_INDEX.get(category, ()))
 
 def is_document_required(document_type: str) -> bool:
     """Check if a document type is required"""
-    return DOCUMENT_TYPES.get(document_type, {}).get('required', False)
+    return _REQUIRED.get(document_type, False)
 
 def get_document_max_age(document_type: str) -> int:
     """Get maximum age in days for a document type"""
-    return DOCUMENT_TYPES.get(document_type, {}).get('max_age_days', 365)
+    return _MAX_AGE.get(document_type, 365)
 
-def get_accepted_formats(document_type: str) -> List[str]:
+def get_accepted_formats(document_type: str) -> tuple:
     """Get accepted file formats for a document type"""
-    return DOCUMENT_TYPES.get(document_type, {}).get('accepted_formats', ['pdf'])
+    return _FORMATS.get(document_type, ('pdf',))
+
+@lru_cache(maxsize=256)
+def _fallback_display(document_type: str) -> str:
+    """Title-cased fallback for unknown types; cached since log paths repeat them"""
+    return document_type.replace('_', ' ').title()
 
 def get_document_display_name(document_type: str) -> str:
     """Get the display name for a document type"""
-    return DOCUMENT_TYPES.get(document_type, {}).get('name', document_type.replace('_', ' ').title())
+    return _NAMES.get(document_type) or _fallback_display(document_type)
 
 def get_document_description(document_type: str) -> str:
     """Get the description for a document type"""
-    return DOCUMENT_TYPES.get(document_type, {}).get('description', '')
+    return _DESCRIPTIONS.get(document_type, '')
 
-def get_document_examples(document_type: str) -> List[str]:
+def get_document_examples(document_type: str) -> Tuple[str, ...]:
     """Get examples for a document type"""
-    return DOCUMENT_TYPES.get(document_type, {}).get('examples', [])
+    return _EXAMPLES.get(document_type, ())
 
 def validate_document_type(document_type: str) -> bool:
     """Validate if a document type is supported"""
-    return document_type in DOCUMENT_TYPES
+    return document_type in _VALID_DOC_TYPES
 
 def get_category_info(category: str) -> Dict[str, Any]:
     """Get information about a document category"""
-    return DOCUMENT_CATEGORIES.get(category, {})
+    return _document_categories().get(category, _EMPTY_RULES)
 
 def get_all_categories() -> Dict[str, Dict[str, Any]]:
     """Get all document categories"""
-    return DOCUMENT_CATEGORIES
+    return _document_categories()
+
+# Bound method avoids re-resolving the attribute in the sort's key callback
+_PRIO_GET = PROCESSING_PRIORITIES.get
 
 def get_processing_priority(document_type: str) -> int:
     """Get processing priority for a document type"""
-    return PROCESSING_PRIORITIES.get(document_type, 0)
+    return _PRIO_GET(document_type, 0)
 
 def sort_documents_by_priority(document_types: List[str]) -> List[str]:
     """Sort document types by processing priority"""
-    return sorted(document_types, key=get_processing_priority, reverse=True)
+    return sorted(document_types, key=lambda d: _PRIO_GET(d, 0), reverse=True)
 
+@lru_cache(maxsize=None)
 def get_validation_requirements(document_type: str) -> Dict[str, Any]:
     """Get validation requirements for a document type"""
-    return VALIDATION_RULES.get(document_type, {})
+    # The frozen table's values are already read-only views
+    return _validation_rules().get(document_type, _EMPTY_RULES)
 
-def get_required_fields(document_type: str) -> List[str]:
+def get_required_fields(document_type: str) -> Tuple[str, ...]:
     """Get required fields for a document type"""
-    return VALIDATION_RULES.get(document_type, {}).get('required_fields', [])
+    return _rule_registry().get(document_type, _DEFAULT_RULE).required_fields
 
-def get_optional_fields(document_type: str) -> List[str]:
+def get_optional_fields(document_type: str) -> Tuple[str, ...]:
     """Get optional fields for a document type"""
-    return VALIDATION_RULES.get(document_type, {}).get('optional_fields', [])
+    return _rule_registry().get(document_type, _DEFAULT_RULE).optional_fields
 
 def get_quality_requirements(document_type: str) -> Dict[str, Any]:
     """Get quality requirements for a document type"""
-    return VALIDATION_RULES.get(document_type, {}).get('quality_requirements', {})
+    return _rule_registry().get(document_type, _DEFAULT_RULE).quality_requirements
 
-def get_validation_checks(document_type: str) -> List[str]:
+def get_validation_checks(document_type: str) -> Tuple[str, ...]:
     """Get validation checks for a document type"""
-    return VALIDATION_RULES.get(document_type, {}).get('validation_checks', [])
+    return _rule_registry().get(document_type, _DEFAULT_RULE).validation_checks
 
 def is_financial_document(document_type: str) -> bool:
     """Check if document is a financial document"""
-    return get_document_category(document_type) == 'financial'
+    return document_type in _FINANCIAL_DOCS
 
 def is_identity_document(document_type: str) -> bool:
     """Check if document is an identity document"""
-    return get_document_category(document_type) == 'identity'
+    return document_type in _IDENTITY_DOCS
 
 def is_income_document(document_type: str) -> bool:
     """Check if document is an income document"""
-    return get_document_category(document_type) == 'income'
+    return document_type in _INCOME_DOCS
+
+# Keyword table inverted below into _KEYWORD_TO_DOCTYPE: each keyword token
+# maps to its document types, so a normalized filename is matched by looking
+# up its tokens instead of scanning per keyword per type
+_SUGGEST_KEYWORDS = {
+    'payslip': ('payslip', 'salary', 'pay_stub', 'wage'),
+    'bank_statement': ('bank', 'statement', 'account'),
+    'id_proof': ('id', 'passport', 'license', 'identity'),
+    'tax_document': ('tax', '1040', 'return', 'w2'),
+    'utility_bill': ('utility', 'electric', 'gas', 'water', 'bill'),
+    'employment_letter': ('employment', 'job', 'work', 'employer'),
+    'credit_report': ('credit', 'score', 'fico', 'bureau'),
+    'property_document': ('property', 'deed', 'title', 'mortgage')
+}
+
+_DELIM_TO_SPACE = str.maketrans('._-', '   ')
+
+# Inverted token index: keywords are normalized the same way as filenames
+# (so 'pay_stub' indexes as 'pay' and 'stub'), and each filename token then
+# resolves with one dict probe instead of a substring scan
+_KEYWORD_TO_DOCTYPE = {
+    token: doc_type
+    for doc_type, keywords in _SUGGEST_KEYWORDS.items()
+    for keyword in keywords
+    for token in keyword.translate(_DELIM_TO_SPACE).split()
+}
 
+@lru_cache(maxsize=1024)
+def _normalize_filename(filename: str) -> str:
+    """Lowercased basename without extension, delimiters mapped to spaces
+
+    OCR pipelines re-validate the same filenames repeatedly, so the
+    normalized form is memoized rather than rebuilt per call.
+    """
+    base = os.path.splitext(os.path.basename(filename))[0].lower()
+    return base.translate(_DELIM_TO_SPACE)
+
+@lru_cache(maxsize=512)
 def get_document_type_suggestions(uploaded_filename: str) -> List[str]:
     """Suggest document types based on filename"""
-    filename_lower = uploaded_filename.lower()
-    suggestions = []
-    
-    # Simple keyword matching for suggestions
-    keyword_mapping = {
-        'payslip': ['payslip', 'salary', 'pay_stub', 'wage'],
-        'bank_statement': ['bank', 'statement', 'account'],
-        'id_proof': ['id', 'passport', 'license', 'identity'],
-        'tax_document': ['tax', '1040', 'return', 'w2'],
-        'utility_bill': ['utility', 'electric', 'gas', 'water', 'bill'],
-        'employment_letter': ['employment', 'job', 'work', 'employer'],
-        'credit_report': ['credit', 'score', 'fico', 'bureau'],
-        'property_document': ['property', 'deed', 'title', 'mortgage']
-    }
-    
-    for doc_type, keywords in keyword_mapping.items():
-        if any(keyword in filename_lower for keyword in keywords):
-            suggestions.append(doc_type)
-    
+    tokens = _normalize_filename(uploaded_filename).split()
+
+    matched = {_KEYWORD_TO_DOCTYPE[token] for token in tokens if token in _KEYWORD_TO_DOCTYPE}
+    suggestions = [doc_type for doc_type in _SUGGEST_KEYWORDS if doc_type in matched]
+
     return suggestions if suggestions else ['payslip']  # Default suggestion
 
+
+@dataclass(frozen=True, slots=True)
+class DocumentMeta:
+    """Every per-type attribute in one object, for bulk metadata queries"""
+    name: str
+    description: str
+    category: str
+    required: bool
+    max_age_days: Any
+    accepted_formats: Tuple[str, ...]
+    priority: int
+    validation: ValidationRule
+
+@lru_cache(maxsize=1)
+def _bundle_cache() -> Dict[str, DocumentMeta]:
+    """One DocumentMeta per type, compiled from the flat tables on first use"""
+    registry = _rule_registry()
+    return {
+        doc_type: DocumentMeta(
+            name=_NAMES[doc_type],
+            description=_DESCRIPTIONS[doc_type],
+            category=_CATEGORY[doc_type],
+            required=_REQUIRED[doc_type],
+            max_age_days=_MAX_AGE[doc_type],
+            accepted_formats=_FORMATS[doc_type],
+            priority=_PRIO_GET(doc_type, 0),
+            validation=registry.get(doc_type, _DEFAULT_RULE)
+        )
+        for doc_type in DOCUMENT_TYPES
+    }
+
+def get_document_bundle(document_types: Iterable[str]) -> Dict[str, DocumentMeta]:
+    """Get full metadata for several document types in a single call
+
+    Pipelines that previously called four or five accessors per document
+    (one Python frame each) can take one DocumentMeta per type instead.
+    Unknown types are silently dropped. Keys are interned so the returned
+    dict carries the canonical vocabulary strings, letting downstream
+    lookups hit the pointer-compare fast path.
+    """
+    cache = _bundle_cache()
+    return {doc_type: cache[doc_type] for doc_type in map(sys.intern, document_types) if doc_type in cache}
@@ -2,14 +2,66 @@
 Helper utilities for the mortgage document automation system
 """
 
+import io
 import os
+import re
+import html
+import time
+import queue
+import base64
+import secrets
 import hashlib
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import streamlit as st
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from itertools import count, islice
+from typing import Optional, Dict, Any, Tuple
 from PIL import Image
-import tempfile
+import shutil
+
+# File hashes here are for change detection and dedup only, not security,
+# so the much faster SIMD/multithreaded BLAKE3 is preferred when installed.
+# Both emit 32-byte hex digests, so stored values stay column-compatible;
+# note that digests are only comparable within one algorithm.
+try:
+    from blake3 import blake3 as _hash_factory
+except ImportError:
+    _hash_factory = hashlib.sha256
+
+try:
+    from zoneinfo import ZoneInfo
+    _EST = ZoneInfo("US/Eastern")
+except Exception:
+    # Missing tzdata on minimal hosts; fall back to local time
+    _EST = None
+
+# Patterns compiled once; these helpers run on every form submit and rerun
+_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_COLLAPSE_RE = re.compile(r'[_\s]+')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NONDIGIT_RE = re.compile(r'\D')
+
+# One-pass replacement table for sanitize_input
+_SANITIZE_TABLE = str.maketrans({'<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+# Characters that make filenames problematic on common filesystems
+_SUSPICIOUS_CHARS = frozenset('<>:"|?*')
+
+_WORD_RE = re.compile(r'\S+')
+
+# Default upload allow-list; frozensets give O(1) membership and the joined
+# string avoids re-rendering the error message per call
+_DEFAULT_ALLOWED_TYPES = frozenset({'pdf', 'jpg', 'jpeg', 'png', 'tiff'})
+_DEFAULT_ALLOWED_TYPES_STR = 'pdf, jpg, jpeg, png, tiff'
+_IMAGE_EXTS = frozenset({'jpg', 'jpeg', 'png', 'tiff'})
+
+def _ext(name: str) -> str:
+    """Lowercased extension without the dot; '' for dotless names."""
+    return os.path.splitext(name)[1][1:].lower()
 
 def initialize_session_state():
     """Initialize Streamlit session state variables"""
@@ -52,9 +104,16 @@ def initialize_session_state():
     if 'analysis_results' not in st.session_state:
         st.session_state.analysis_results = {}
     
-    # Notification system
+    # Notification system: deque of active notifications only; dismissed
+    # ones are dropped right after display instead of flagged and rescanned
     if 'notifications' not in st.session_state:
-        st.session_state.notifications = []
+        st.session_state.notifications = deque()
+    if 'notification_counter' not in st.session_state:
+        st.session_state.notification_counter = count()
+
+    # Stable id for correlating audit-log events within a session
+    if '_session_id' not in st.session_state:
+        st.session_state._session_id = secrets.token_hex(16)
     
     # Settings and preferences
     if 'user_preferences' not in st.session_state:
@@ -65,8 +124,13 @@ def initialize_session_state():
             'notification_level': 'normal'
         }
 
+@lru_cache(maxsize=1)
 def _get_assessor_credentials() -> Dict[str, str]:
-    """Fetch assessor credentials from env or Streamlit secrets."""
+    """Fetch assessor credentials from env or Streamlit secrets.
+
+    Cached for the process lifetime: secrets and env vars don't change
+    between Streamlit reruns, and the login page re-renders per keystroke.
+    """
     username = None
     password = None
     try:
@@ -103,7 +167,12 @@ def render_assessor_login() -> bool:
     login_clicked = st.button("Sign In", type="primary")
     
     if login_clicked:
-        if username_input == creds['username'] and password_input == creds['password']:
+        # compare_digest: constant-time over the full length, no short-circuit.
+        # Compare as bytes — the str overload rejects non-ASCII input
+        if (secrets.compare_digest((username_input or "").encode('utf-8'),
+                                   creds['username'].encode('utf-8'))
+                and secrets.compare_digest((password_input or "").encode('utf-8'),
+                                           creds['password'].encode('utf-8'))):
             st.session_state.assessor_authenticated = True
             st.session_state.assessor_username = username_input
             add_notification("Login successful.", "success")
@@ -118,49 +187,111 @@ def assessor_logout():
     """Log out the assessor user and clear auth state."""
     st.session_state.assessor_authenticated = False
     st.session_state.assessor_username = None
+    # Re-read secrets/env on the next login in case they were rotated
+    _get_assessor_credentials.cache_clear()
+
+def _drop_page_cache(file_path: str):
+    """Advise the kernel not to cache a file that was written once.
+
+    Uploads are saved and rarely re-read in-process, so their pages would
+    only evict more useful cache entries.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+# Opportunistic hashing: some portal exports carry the document's SHA-256
+# in the filename. Trusting it skips a full I/O pass, but it IS trusting
+# the filename, so it stays off unless explicitly enabled. Hex lookarounds
+# instead of \b: filename tokens are usually underscore-delimited, and the
+# stored names get a {timestamp}_ prefix
+_HEX64_RE = re.compile(r'(?<![0-9a-fA-F])([0-9a-fA-F]{64})(?![0-9a-fA-F])')
+_TRUST_FILENAME_HASHES = os.getenv('MORTGAGEFLOW_TRUST_FILENAME_HASHES', '') == '1'
+
+def save_and_hash(uploaded_file, application_id: str) -> Tuple[str, str]:
+    """Save uploaded file and compute its content hash in a single streaming pass.
+
+    With MORTGAGEFLOW_TRUST_FILENAME_HASHES=1, a 64-hex token embedded in
+    the original upload name is returned as the hash without hashing the
+    content.
+    """
 
-def save_uploaded_file(uploaded_file, application_id: str) -> str:
-    """Save uploaded file to local storage and return file path"""
-    
     try:
         # Create uploads directory if it doesn't exist
         uploads_dir = os.path.join("uploads", application_id)
         os.makedirs(uploads_dir, exist_ok=True)
-        
-        # Generate unique filename to avoid conflicts
+
+        # Generate unique filename to avoid conflicts; sanitize once here so
+        # the stored name never needs rescanning
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_extension = uploaded_file.name.split('.')[-1].lower()
-        safe_filename = f"{timestamp}_{uploaded_file.name}"
-        
+        safe_filename = f"{timestamp}_{clean_filename(uploaded_file.name)}"
+
         file_path = os.path.join(uploads_dir, safe_filename)
-        
-        # Save the file
-        with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
+
+        # Opportunistic hashing: when enabled and the original filename
+        # embeds a 64-hex token, trust it and skip the hashing work
+        trusted_hash = None
+        if _TRUST_FILENAME_HASHES:
+            m = _HEX64_RE.search(uploaded_file.name)
+            if m:
+                trusted_hash = m.group(1).lower()
+
+        uploaded_file.seek(0)
+
+        if trusted_hash is not None:
+            # Unbuffered: each 4MiB block goes straight to the kernel
+            # without a second userspace copy
+            with open(file_path, "wb", buffering=0) as f:
+                shutil.copyfileobj(uploaded_file, f, length=4 * 1024 * 1024)
+
+            _drop_page_cache(file_path)
+            logging.info(f"File saved successfully: {file_path}")
+            return file_path, trusted_hash
+
+        # Write and hash each chunk as it is read, so the upload is consumed
+        # once instead of being saved to disk and then re-read for hashing
+        file_hash = _hash_factory()
+
+        with open(file_path, "wb", buffering=0) as f:
+            while chunk := uploaded_file.read(1 << 20):
+                f.write(chunk)
+                file_hash.update(chunk)
+
+        _drop_page_cache(file_path)
         logging.info(f"File saved successfully: {file_path}")
-        return file_path
-        
+        return file_path, file_hash.hexdigest()
+
     except Exception as e:
         logging.error(f"Failed to save uploaded file: {str(e)}")
         raise Exception(f"File save failed: {str(e)}")
 
-def get_file_hash(file_path: str) -> str:
-    """Generate SHA-256 hash of file for integrity checking"""
-    
-    try:
-        sha256_hash = hashlib.sha256()
-        
-        with open(file_path, "rb") as f:
-            # Read and update hash string value in blocks of 4K
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        
-        return sha256_hash.hexdigest()
-        
-    except Exception as e:
-        logging.error(f"Failed to generate file hash: {str(e)}")
-        return "unknown"
+def process_upload_batch(files, application_id: str, max_workers: Optional[int] = None) -> list:
+    """Validate, save and hash a batch of uploads concurrently.
+
+    Hashing and disk writes release the GIL, so a small thread pool gets
+    near-linear speedup on multi-file applications. The pool is bounded to
+    avoid holding many large uploads in flight at once. Results are
+    returned in input order; files that fail validation are not saved.
+    """
+
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 4)
+
+    def _process_one(uploaded_file):
+        validation = validate_file_upload(uploaded_file)
+        if not validation['is_valid']:
+            return {'validation': validation, 'file_path': None, 'file_hash': None}
+        file_path, file_hash = save_and_hash(uploaded_file, application_id)
+        return {'validation': validation, 'file_path': file_path, 'file_hash': file_hash}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_process_one, files))
 
 def validate_file_upload(uploaded_file, allowed_types: Optional[list] = None, max_size_mb: int = 10) -> Dict[str, Any]:
     """Validate uploaded file for type, size, and basic integrity"""
@@ -173,8 +304,11 @@ def validate_file_upload(uploaded_file, allowed_types: Optional[list] = None, ma
     }
     
     if allowed_types is None:
-        allowed_types = ['pdf', 'jpg', 'jpeg', 'png', 'tiff']
-    
+        allowed_types = _DEFAULT_ALLOWED_TYPES
+        allowed_types_str = _DEFAULT_ALLOWED_TYPES_STR
+    else:
+        allowed_types_str = ', '.join(allowed_types)
+
     try:
         # Check file exists
         if uploaded_file is None:
@@ -182,8 +316,8 @@ def validate_file_upload(uploaded_file, allowed_types: Optional[list] = None, ma
             validation_result['errors'].append("No file uploaded")
             return validation_result
         
-        # Check file size
-        file_size = len(uploaded_file.getbuffer())
+        # Check file size: Streamlit exposes it without materializing a buffer
+        file_size = uploaded_file.size
         file_size_mb = file_size / (1024 * 1024)
         
         validation_result['file_info']['size_bytes'] = file_size
@@ -194,34 +328,29 @@ def validate_file_upload(uploaded_file, allowed_types: Optional[list] = None, ma
             validation_result['errors'].append(f"File size ({file_size_mb:.2f} MB) exceeds maximum allowed size ({max_size_mb} MB)")
         
         # Check file type
-        file_extension = uploaded_file.name.split('.')[-1].lower()
+        file_extension = _ext(uploaded_file.name)
         validation_result['file_info']['extension'] = file_extension
         validation_result['file_info']['filename'] = uploaded_file.name
         
         if file_extension not in allowed_types:
             validation_result['is_valid'] = False
-            validation_result['errors'].append(f"File type '{file_extension}' not allowed. Allowed types: {', '.join(allowed_types)}")
-        
+            validation_result['errors'].append(f"File type '{file_extension}' not allowed. Allowed types: {allowed_types_str}")
+
         # Additional validation for image files
-        if file_extension in ['jpg', 'jpeg', 'png', 'tiff']:
+        if file_extension in _IMAGE_EXTS:
             try:
-                # Try to open the image to verify it's valid
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_extension}")
-                temp_file.write(uploaded_file.getbuffer())
-                temp_file.close()
-                
-                with Image.open(temp_file.name) as img:
+                # PIL reads the in-memory upload directly; no temp-file copy
+                uploaded_file.seek(0)
+                with Image.open(uploaded_file) as img:
                     validation_result['file_info']['image_size'] = img.size
                     validation_result['file_info']['image_mode'] = img.mode
-                    
+
                     # Check image quality
                     width, height = img.size
                     if width < 300 or height < 300:
                         validation_result['warnings'].append("Image resolution is low. This may affect text extraction quality.")
-                
-                # Clean up temp file
-                os.unlink(temp_file.name)
-                
+                uploaded_file.seek(0)
+
             except Exception as e:
                 validation_result['warnings'].append(f"Could not validate image: {str(e)}")
         
@@ -230,8 +359,7 @@ def validate_file_upload(uploaded_file, allowed_types: Optional[list] = None, ma
             validation_result['warnings'].append("Filename is very long. Consider using a shorter name.")
         
         # Check for suspicious characters in filename
-        suspicious_chars = ['<', '>', ':', '"', '|', '?', '*']
-        if any(char in uploaded_file.name for char in suspicious_chars):
+        if not _SUSPICIOUS_CHARS.isdisjoint(uploaded_file.name):
             validation_result['warnings'].append("Filename contains potentially problematic characters.")
         
     except Exception as e:
@@ -240,30 +368,92 @@ def validate_file_upload(uploaded_file, allowed_types: Optional[list] = None, ma
     
     return validation_result
 
+def validate_file_upload_head(filename: str, size_bytes: int, head: bytes,
+                              allowed_types: Optional[list] = None, max_size_mb: int = 10) -> Dict[str, Any]:
+    """Validate an upload from its name, size and first bytes only
+
+    Bounded-read variant of validate_file_upload: type sniffing needs only
+    the leading magic bytes, so large files aren't pulled through memory
+    just to check their format.
+    """
+
+    validation_result = {
+        'is_valid': True,
+        'errors': [],
+        'warnings': [],
+        'file_info': {}
+    }
+
+    if allowed_types is None:
+        allowed_types = _DEFAULT_ALLOWED_TYPES
+        allowed_types_str = _DEFAULT_ALLOWED_TYPES_STR
+    else:
+        allowed_types_str = ', '.join(allowed_types)
+
+    try:
+        # Check file size
+        file_size_mb = size_bytes / (1024 * 1024)
+
+        validation_result['file_info']['size_bytes'] = size_bytes
+        validation_result['file_info']['size_mb'] = round(file_size_mb, 2)
+
+        if file_size_mb > max_size_mb:
+            validation_result['is_valid'] = False
+            validation_result['errors'].append(f"File size ({file_size_mb:.2f} MB) exceeds maximum allowed size ({max_size_mb} MB)")
+
+        # Check file type
+        file_extension = _ext(filename)
+        validation_result['file_info']['extension'] = file_extension
+        validation_result['file_info']['filename'] = filename
+
+        if file_extension not in allowed_types:
+            validation_result['is_valid'] = False
+            validation_result['errors'].append(f"File type '{file_extension}' not allowed. Allowed types: {allowed_types_str}")
+
+        # Magic-byte check: the leading bytes identify every supported format
+        magic_ok = (
+            head.startswith(b'%PDF') or       # PDF
+            head.startswith(b'\xff\xd8') or   # JPEG
+            head.startswith(b'\x89PNG') or    # PNG
+            head.startswith(b'II*\x00') or    # TIFF (little-endian)
+            head.startswith(b'MM\x00*')       # TIFF (big-endian)
+        )
+        if head and not magic_ok:
+            validation_result['warnings'].append("File content does not match a supported document format signature.")
+
+        # Check filename for potential issues
+        if len(filename) > 100:
+            validation_result['warnings'].append("Filename is very long. Consider using a shorter name.")
+
+        if not _SUSPICIOUS_CHARS.isdisjoint(filename):
+            validation_result['warnings'].append("Filename contains potentially problematic characters.")
+
+    except Exception as e:
+        validation_result['is_valid'] = False
+        validation_result['errors'].append(f"File validation error: {str(e)}")
+
+    return validation_result
+
 def format_file_size(size_bytes: int) -> str:
     """Convert bytes to human readable file size"""
     
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
-    
-    size_names = ["B", "KB", "MB", "GB"]
-    import math
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
-    
-    return f"{s} {size_names[i]}"
+
+    # Unit index is just the number of whole 10-bit shifts in the size
+    i = min((size_bytes.bit_length() - 1) // 10, 3)
+    s = round(size_bytes / (1 << (10 * i)), 2)
+
+    return f"{s} {('B', 'KB', 'MB', 'GB')[i]}"
 
 def clean_filename(filename: str) -> str:
     """Clean filename to remove problematic characters"""
-    
-    import re
-    
+
     # Remove or replace problematic characters
-    cleaned = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
+    cleaned = _FILENAME_RE.sub('_', filename)
+
     # Remove extra spaces and underscores
-    cleaned = re.sub(r'[_\s]+', '_', cleaned)
+    cleaned = _COLLAPSE_RE.sub('_', cleaned)
     
     # Limit length
     if len(cleaned) > 100:
@@ -276,41 +466,51 @@ def add_notification(message: str, notification_type: str = "info", auto_dismiss
     """Add a notification to the session state"""
     
     notification = {
-        'id': len(st.session_state.notifications),
+        'id': next(st.session_state.notification_counter),
         'message': message,
         'type': notification_type,  # info, success, warning, error
         'timestamp': datetime.now(),
-        'auto_dismiss': auto_dismiss,
-        'dismissed': False
+        'auto_dismiss': auto_dismiss
     }
-    
+
     st.session_state.notifications.append(notification)
 
+# Styles approximating st.success/st.warning/st.error/st.info banners
+_NOTIFICATION_STYLES = {
+    'success': 'background-color:#d4edda;color:#155724;',
+    'warning': 'background-color:#fff3cd;color:#856404;',
+    'error': 'background-color:#f8d7da;color:#721c24;',
+    'info': 'background-color:#d1ecf1;color:#0c5460;',
+}
+
 def display_notifications():
     """Display all active notifications"""
-    
-    active_notifications = [n for n in st.session_state.notifications if not n['dismissed']]
-    
-    for notification in active_notifications:
-        notification_type = notification['type']
-        message = notification['message']
-        
-        if notification_type == "success":
-            st.success(message)
-        elif notification_type == "warning":
-            st.warning(message)
-        elif notification_type == "error":
-            st.error(message)
-        else:
-            st.info(message)
-        
-        # Auto-dismiss after showing
-        if notification['auto_dismiss']:
-            notification['dismissed'] = True
+
+    active = st.session_state.notifications
+    kept = deque()
+    parts = []
+
+    while active:
+        notification = active.popleft()
+        style = _NOTIFICATION_STYLES.get(notification['type'], _NOTIFICATION_STYLES['info'])
+        parts.append(
+            f'<div style="{style}padding:0.75rem 1rem;border-radius:0.5rem;'
+            f'margin-bottom:0.5rem;">{html.escape(notification["message"])}</div>'
+        )
+
+        # Auto-dismissed notifications are dropped here; sticky ones survive
+        if not notification['auto_dismiss']:
+            kept.append(notification)
+
+    st.session_state.notifications = kept
+
+    # One markdown call — one protocol frame — regardless of notification count
+    if parts:
+        st.markdown('\n'.join(parts), unsafe_allow_html=True)
 
 def clear_notifications():
     """Clear all notifications"""
-    st.session_state.notifications = []
+    st.session_state.notifications = deque()
 
 def get_user_preference(key: str, default_value: Any = None) -> Any:
     """Get user preference value"""
@@ -324,18 +524,18 @@ def cache_applications(applications: list, ttl_minutes: int = 5):
     """Cache applications data with TTL"""
     
     st.session_state.applications_cache = applications
-    st.session_state.cache_timestamp = datetime.now()
+    # Monotonic float: freshness checks don't need wall-clock semantics
+    st.session_state.cache_timestamp = time.monotonic()
 
 def get_cached_applications(ttl_minutes: int = 5) -> Optional[list]:
     """Get cached applications if not expired"""
-    
+
     if not st.session_state.cache_timestamp:
         return None
-    
-    time_diff = datetime.now() - st.session_state.cache_timestamp
-    if time_diff.total_seconds() > (ttl_minutes * 60):
+
+    if time.monotonic() - st.session_state.cache_timestamp > ttl_minutes * 60:
         return None
-    
+
     return st.session_state.applications_cache
 
 def clear_cache():
@@ -379,97 +579,104 @@ def sanitize_input(input_string: str) -> str:
     if not isinstance(input_string, str):
         return str(input_string)
     
-    # Remove potentially dangerous characters
-    sanitized = input_string.replace('<', '&lt;').replace('>', '&gt;')
-    sanitized = sanitized.replace('"', '&quot;').replace("'", '&#x27;')
-    
-    return sanitized.strip()
+    # Remove potentially dangerous characters in one translate pass
+    return input_string.translate(_SANITIZE_TABLE).strip()
 
 def validate_email(email: str) -> bool:
     """Basic email validation"""
-    
-    import re
-    
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+
+    return _EMAIL_RE.match(email) is not None
 
 def validate_phone(phone: str) -> bool:
     """Basic phone number validation"""
-    
-    import re
-    
+
     # Remove all non-digit characters
-    digits_only = re.sub(r'\D', '', phone)
-    
+    digits_only = _NONDIGIT_RE.sub('', phone)
+
     # Check if it has appropriate length
     return 10 <= len(digits_only) <= 15
 
 def generate_application_id() -> str:
     """Generate a unique application ID"""
-    
-    import uuid
-    
-    # Generate a short, readable ID
-    full_uuid = str(uuid.uuid4())
-    short_id = full_uuid.split('-')[0].upper()
-    
-    # Add timestamp component for uniqueness
-    timestamp_component = datetime.now().strftime("%m%d")
-    
-    return f"APP-{timestamp_component}-{short_id}"
+
+    # Same shape as before (APP-MMDD-8 hex chars) without building and
+    # splitting a full UUID string
+    return f"APP-{datetime.now():%m%d}-{secrets.token_hex(4).upper()}"
 
 def create_download_link(data: bytes, filename: str, mime_type: str = "application/octet-stream") -> str:
-    """Create a download link for data"""
-    
-    import base64
-    
-    b64 = base64.b64encode(data).decode()
-    return f'<a href="data:{mime_type};base64,{b64}" download="{filename}">Download {filename}</a>'
+    """Create an HTML download link for data.
+
+    Prefer st.download_button for new UI code; this keeps the data-URI
+    anchor for markdown embedding. The payload is base64-encoded in
+    3 MiB chunks (which encode to whole 4 MiB blocks, so no mid-stream
+    padding) over a memoryview, so large exports never hold raw bytes,
+    base64 bytes and the decoded string all at once.
+    """
+
+    buf = io.StringIO()
+    buf.write(f'<a href="data:{mime_type};base64,')
+    view = memoryview(data)
+    for start in range(0, len(view), 3 * 1024 * 1024):
+        buf.write(base64.b64encode(view[start:start + 3 * 1024 * 1024]).decode('ascii'))
+    buf.write(f'" download="{filename}">Download {filename}</a>')
+    return buf.getvalue()
+
+# Audit logging goes through a queue so the widget-event path only pays for
+# a Queue.put; formatting and the stderr write happen on the listener thread
+_action_logger = logging.getLogger('mortgageflow.user_actions')
+if not _action_logger.handlers:
+    _log_queue = queue.Queue(-1)
+    _action_logger.addHandler(QueueHandler(_log_queue))
+    _action_logger.setLevel(logging.INFO)
+    _action_logger.propagate = False
+    _log_listener = QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
 
 def log_user_action(action: str, details: Optional[Dict[str, Any]] = None):
     """Log user actions for audit trail"""
-    
+
     log_entry = {
         'timestamp': datetime.now().isoformat(),
         'user_role': st.session_state.get('user_role', 'Unknown'),
         'action': action,
         'details': details or {},
-        'session_id': id(st.session_state)  # Simple session tracking
+        'session_id': st.session_state.get('_session_id', '')
     }
-    
-    logging.info(f"User Action: {log_entry}")
+
+    _action_logger.info("User Action: %s", log_entry)
+
+_FILE_ICONS = {
+    'pdf': '📄',
+    'jpg': '🖼️',
+    'jpeg': '🖼️',
+    'png': '🖼️',
+    'tiff': '🖼️',
+    'doc': '📝',
+    'docx': '📝',
+    'xls': '📊',
+    'xlsx': '📊',
+    'txt': '📃'
+}
 
 def get_file_icon(file_extension: str) -> str:
-    """Get appropriate icon for file type"""
-    
-    icon_mapping = {
-        'pdf': '📄',
-        'jpg': '🖼️',
-        'jpeg': '🖼️',
-        'png': '🖼️',
-        'tiff': '🖼️',
-        'doc': '📝',
-        'docx': '📝',
-        'xls': '📊',
-        'xlsx': '📊',
-        'txt': '📃'
-    }
-    
-    return icon_mapping.get(file_extension.lower(), '📁')
+    """Get appropriate icon for file type. Expects a lowercased extension."""
+
+    return _FILE_ICONS.get(file_extension, '📁')
 
 def extract_text_preview(text: str, max_words: int = 50) -> str:
     """Extract a preview of text content"""
     
     if not text:
         return "No text content available"
-    
-    words = text.split()
-    
+
+    # Scan only as far as the preview needs instead of tokenizing the whole
+    # document (OCR text can run to millions of words)
+    words = [m.group(0) for m in islice(_WORD_RE.finditer(text), max_words + 1)]
+
     if len(words) <= max_words:
         return text
-    
-    preview_words = words[:max_words]
-    return ' '.join(preview_words) + '...'
+
+    return ' '.join(words[:max_words]) + '...'
 
 def calculate_processing_time(start_time: datetime, end_time: Optional[datetime] = None) -> str:
     """Calculate and format processing time"""
@@ -488,37 +695,24 @@ def calculate_processing_time(start_time: datetime, end_time: Optional[datetime]
 
 def is_business_hours() -> bool:
     """Check if current time is within business hours (9 AM - 5 PM EST)"""
-    
-    from datetime import datetime
-    import pytz
-    
-    try:
-        est = pytz.timezone('US/Eastern')
-        current_time = datetime.now(est)
-        
-        # Check if it's a weekday (Monday = 0, Sunday = 6)
-        if current_time.weekday() >= 5:  # Weekend
-            return False
-        
-        # Check if within business hours (9 AM - 5 PM)
-        return 9 <= current_time.hour < 17
-        
-    except:
-        # If timezone handling fails, assume business hours
-        return True
+
+    current_time = datetime.now(_EST) if _EST else datetime.now()
+
+    # Weekday (Monday = 0, Sunday = 6) and within 9 AM - 5 PM
+    return current_time.weekday() < 5 and 9 <= current_time.hour < 17
+
+_STATUS_COLORS = {
+    'pending': '#FFA500',    # Orange
+    'processing': '#1E90FF', # Blue
+    'completed': '#32CD32',  # Green
+    'error': '#FF4500',      # Red
+    'warning': '#FFD700'     # Gold
+}
 
 def get_processing_status_color(status: str) -> str:
-    """Get color code for processing status"""
-    
-    color_mapping = {
-        'pending': '#FFA500',    # Orange
-        'processing': '#1E90FF', # Blue
-        'completed': '#32CD32',  # Green
-        'error': '#FF4500',      # Red
-        'warning': '#FFD700'     # Gold
-    }
-    
-    return color_mapping.get(status.lower(), '#808080')  # Gray default
+    """Get color code for processing status. Expects a lowercased status."""
+
+    return _STATUS_COLORS.get(status, '#808080')  # Gray default
 
 def estimate_processing_time(file_size_mb: float, document_type: str) -> str:
     """Estimate processing time based on file size and type"""